@@ -72,6 +72,7 @@ class LCWClient:
         read_timeout: int = 30,
         max_retries: int = 3,
         enable_caching: bool = True,
+        pool_maxsize: int = 10,
     ):
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
@@ -79,6 +80,7 @@ class LCWClient:
         self.read_timeout = read_timeout
         self.timeout = (connect_timeout, read_timeout)  # (connect, read)
         self.enable_caching = enable_caching
+        self.pool_maxsize = pool_maxsize  # Max keep-alive connections per host
 
         # Circuit breaker for API health
         self.circuit_breaker = CircuitBreaker(failure_threshold=5, timeout=60)
@@ -87,13 +89,18 @@ class LCWClient:
         self.session = requests.Session()
         retry_strategy = Retry(
             total=max_retries,
-            backoff_factor=2,  # Exponential backoff: 2, 4, 8 seconds
+            # Exponential backoff with jitter: 0, 1, 2 seconds (+0-0.5s), capped
+            # at 30s. A Retry-After header on 429/503 takes precedence
+            backoff_factor=0.5,
+            backoff_jitter=0.5,
+            backoff_max=30,
+            respect_retry_after_header=True,
             status_forcelist=[429, 500, 502, 503, 504, 520, 521, 522, 523, 524],
             allowed_methods=["POST"],  # LCW API uses POST for everything
             raise_on_status=False,  # Handle status codes manually
         )
         adapter = HTTPAdapter(
-            max_retries=retry_strategy, pool_connections=2, pool_maxsize=5
+            max_retries=retry_strategy, pool_connections=2, pool_maxsize=pool_maxsize
         )
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
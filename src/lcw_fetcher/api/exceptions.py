@@ -4,6 +4,10 @@
 class LCWAPIError(Exception):
     """Base exception for LCW API errors"""
 
+    # BaseException still provides a lazily created __dict__, but keeping
+    # these in slots means it is never allocated for the common case
+    __slots__ = ("status_code", "response_data")
+
     def __init__(
         self, message: str, status_code: int = None, response_data: dict = None
     ):
@@ -11,6 +15,15 @@ class LCWAPIError(Exception):
         self.status_code = status_code
         self.response_data = response_data
 
+    def __reduce__(self):
+        # BaseException pickles args and __dict__ only, which would drop
+        # the slot values; keep __dict__ so notes from add_note() survive
+        return (
+            self.__class__,
+            (*self.args, self.status_code, self.response_data),
+            getattr(self, "__dict__", None),
+        )
+
     def __repr__(self):
         if self.status_code:
             return f"LCWAPIError('{self}', status_code={self.status_code})"
@@ -23,22 +36,22 @@ class LCWAPIError(Exception):
 class LCWRateLimitError(LCWAPIError):
     """Raised when API rate limit is exceeded"""
 
-    pass
+    __slots__ = ()
 
 
 class LCWAuthError(LCWAPIError):
     """Raised when API authentication fails"""
 
-    pass
+    __slots__ = ()
 
 
 class LCWValidationError(LCWAPIError):
     """Raised when request validation fails"""
 
-    pass
+    __slots__ = ()
 
 
 class LCWNetworkError(LCWAPIError):
     """Raised when network/connection issues occur"""
 
-    pass
+    __slots__ = ()
@@ -1,3 +1,4 @@
+import threading
 import time
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
@@ -26,24 +27,27 @@ class DataFetcher:
             bucket=config.influxdb_bucket,
         )
 
-        # Rate limiting
+        # Rate limiting; the lock makes callers on different threads take
+        # turns instead of all passing the limiter at once
         self._last_request_time = 0
         self._request_interval = 60.0 / config.requests_per_minute
-
-    def _rate_limit(self) -> None:
-        """Implement rate limiting between API requests"""
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self._request_interval:
-            sleep_time = self._request_interval - elapsed
-            logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
-            time.sleep(sleep_time)
-        self._last_request_time = time.time()
+        self._rate_limit_lock = threading.Lock()
+
+    def rate_limit(self) -> None:
+        """Wait until the next API request is allowed by the rate limit"""
+        with self._rate_limit_lock:
+            elapsed = time.time() - self._last_request_time
+            if elapsed < self._request_interval:
+                sleep_time = self._request_interval - elapsed
+                logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
+                time.sleep(sleep_time)
+            self._last_request_time = time.time()
 
     def check_api_status(self) -> bool:
         """Check if the LCW API is accessible"""
         with PerformanceContext("api_status_check"):
             try:
-                self._rate_limit()
+                self.rate_limit()
                 status = self.lcw_client.check_status()
                 logger.info("API status check successful")
                 return True
@@ -55,7 +59,7 @@ class DataFetcher:
         """Get remaining API credits"""
         with PerformanceContext("api_credits_check"):
             try:
-                self._rate_limit()
+                self.rate_limit()
                 credits = self.lcw_client.get_credits()
                 logger.info(
                     f"API credits remaining: {credits.get('dailyCreditsRemaining', 'unknown')}"
@@ -73,7 +77,7 @@ class DataFetcher:
         with PerformanceContext("fetch_coins_list", {"limit": limit}):
             coins = []
             try:
-                self._rate_limit()
+                self.rate_limit()
                 coins = self.lcw_client.get_coins_list(limit=limit, meta=True)
                 logger.info(f"Fetched {len(coins)} coins from API")
                 return coins
@@ -106,7 +110,7 @@ class DataFetcher:
                 logger.info(f"Fetching page {page + 1}/{total_pages} (offset: {offset}, limit: {coins_per_page})")
                 
                 try:
-                    self._rate_limit()
+                    self.rate_limit()
                     page_coins = self.lcw_client.get_coins_list(
                         limit=coins_per_page, 
                         offset=offset, 
@@ -144,7 +148,7 @@ class DataFetcher:
             for code in coin_codes:
                 with PerformanceContext(f"fetch_coin_{code}"):
                     try:
-                        self._rate_limit()
+                        self.rate_limit()
                         coin = self.lcw_client.get_coin_single(code=code, meta=True)
                         coins.append(coin)
                         logger.debug(f"Fetched data for {code}")
@@ -166,7 +170,7 @@ class DataFetcher:
     def fetch_exchanges_list(self, limit: int = 50) -> List[Exchange]:
         """Fetch list of exchanges from the API"""
         try:
-            self._rate_limit()
+            self.rate_limit()
             exchanges = self.lcw_client.get_exchanges_list(limit=limit)
             logger.info(f"Fetched {len(exchanges)} exchanges from API")
             return exchanges
@@ -185,7 +189,7 @@ class DataFetcher:
     def fetch_market_overview(self) -> List[Market]:
         """Fetch market overview data"""
         try:
-            self._rate_limit()
+            self.rate_limit()
             markets = self.lcw_client.get_overview()
             logger.info(f"Fetched {len(markets)} market overview records")
             return markets
@@ -207,7 +211,7 @@ class DataFetcher:
         start_time = end_time - timedelta(hours=hours_back)
 
         try:
-            self._rate_limit()
+            self.rate_limit()
             coin_with_history = self.lcw_client.get_coin_history(
                 code=code, start=start_time, end=end_time, meta=True
             )
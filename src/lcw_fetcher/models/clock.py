@@ -0,0 +1,6 @@
+from datetime import datetime
+
+
+def utcnow() -> datetime:
+    """Current UTC time, used as the fetched_at default of every model"""
+    return datetime.utcnow()
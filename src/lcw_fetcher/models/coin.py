@@ -3,6 +3,8 @@ from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field, field_validator
 
+from .clock import utcnow
+
 
 class CoinDelta(BaseModel):
     """Rate of change data for different time periods"""
@@ -85,7 +87,7 @@ class Coin(BaseModel):
 
     # Metadata
     fetched_at: datetime = Field(
-        default_factory=datetime.utcnow, description="When this data was fetched"
+        default_factory=utcnow, description="When this data was fetched"
     )
     currency: str = Field(default="USD", description="Currency for price data")
 
@@ -3,6 +3,8 @@ from typing import Any, Dict, Optional
 
 from pydantic import BaseModel, Field, field_validator
 
+from .clock import utcnow
+
 
 class Exchange(BaseModel):
     """Exchange data model based on LCW API"""
@@ -17,7 +19,7 @@ class Exchange(BaseModel):
     volumePerVisitor: Optional[float] = Field(None, description="Volume per visitor")
 
     # Metadata
-    fetched_at: datetime = Field(default_factory=datetime.utcnow)
+    fetched_at: datetime = Field(default_factory=utcnow)
     currency: str = Field(default="USD")
 
     @field_validator("code")
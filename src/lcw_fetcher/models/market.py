@@ -3,6 +3,8 @@ from typing import Any, Dict, Optional
 
 from pydantic import BaseModel, Field
 
+from .clock import utcnow
+
 
 class Market(BaseModel):
     """Market overview data model"""
@@ -13,7 +15,7 @@ class Market(BaseModel):
     btcDominance: Optional[float] = Field(None, description="Bitcoin dominance ratio")
 
     # Metadata
-    fetched_at: datetime = Field(default_factory=datetime.utcnow)
+    fetched_at: datetime = Field(default_factory=utcnow)
     currency: str = Field(default="USD")
 
     def to_influx_point(self) -> Dict[str, Any]:
@@ -300,6 +300,10 @@ class APIResponseCache:
         """Get cache statistics"""
         return self._cache.get_stats()
 
+    def clear(self) -> None:
+        """Clear all cached API responses"""
+        self._cache.clear()
+
 
 # Global API response cache
 api_cache = APIResponseCache()
@@ -7,6 +7,8 @@ used across all test modules.
 
 import os
 from datetime import datetime, timedelta
+from itertools import cycle
+from types import MappingProxyType
 from typing import Any, Dict, List
 from unittest.mock import MagicMock, Mock
 
@@ -19,6 +21,11 @@ os.environ["INFLUX_TOKEN"] = "test_token"
 os.environ["INFLUX_ORG"] = "test_org"
 os.environ["INFLUX_BUCKET"] = "test_bucket"
 
+# The performance validator is a standalone script run against live services;
+# it imports the installed lcw_fetcher package rather than src.lcw_fetcher, so
+# collecting it here would register the package's Prometheus metrics twice
+collect_ignore = ["performance/test_performance_optimizations.py"]
+
 
 @pytest.fixture
 def mock_api_key():
@@ -26,78 +33,102 @@ def mock_api_key():
     return "test_api_key_12345"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_coin_data():
-    """Fixture providing sample coin data as returned by the LCW API."""
-    return {
-        "code": "BTC",
-        "name": "Bitcoin",
-        "symbol": "BTC",
-        "rank": 1,
-        "age": 5000,
-        "color": "#f7931a",
-        "png32": "https://lcw.nyc3.cdn.digitaloceanspaces.com/production/currencies/32/btc.png",
-        "png64": "https://lcw.nyc3.cdn.digitaloceanspaces.com/production/currencies/64/btc.png",
-        "webp32": "https://lcw.nyc3.cdn.digitaloceanspaces.com/production/currencies/32/btc.webp",
-        "webp64": "https://lcw.nyc3.cdn.digitaloceanspaces.com/production/currencies/64/btc.webp",
-        "exchanges": 420,
-        "markets": 9821,
-        "pairs": 3234,
-        "rate": 45000.50,
-        "volume": 28500000000.0,
-        "cap": 850000000000.0,
-        "liquidity": 125000000.0,
-        "totalCap": 900000000000.0,
-        "allTimeHighUSD": 69000.0,
-        "circulatingSupply": 19000000.0,
-        "totalSupply": 19500000.0,
-        "maxSupply": 21000000.0,
-        "categories": ["Currency", "Store of Value"],
-        "delta": {
-            "hour": 0.5,
-            "day": 2.3,
-            "week": -1.2,
-            "month": 15.7,
-            "quarter": 8.4,
-            "year": 45.8,
-        },
-        "currency": "USD",
-        "fetched_at": datetime.utcnow().isoformat(),
-    }
+    """Fixture providing sample coin data as returned by the LCW API.
+
+    Built once per session and read-only at the top level; tests that need a
+    variation should copy it, e.g. ``{**sample_coin_data, "code": "ETH"}``.
+    """
+    return MappingProxyType(
+        {
+            "code": "BTC",
+            "name": "Bitcoin",
+            "symbol": "BTC",
+            "rank": 1,
+            "age": 5000,
+            "color": "#f7931a",
+            "png32": "https://lcw.nyc3.cdn.digitaloceanspaces.com/production/currencies/32/btc.png",
+            "png64": "https://lcw.nyc3.cdn.digitaloceanspaces.com/production/currencies/64/btc.png",
+            "webp32": "https://lcw.nyc3.cdn.digitaloceanspaces.com/production/currencies/32/btc.webp",
+            "webp64": "https://lcw.nyc3.cdn.digitaloceanspaces.com/production/currencies/64/btc.webp",
+            "exchanges": 420,
+            "markets": 9821,
+            "pairs": 3234,
+            "rate": 45000.50,
+            "volume": 28500000000.0,
+            "cap": 850000000000.0,
+            "liquidity": 125000000.0,
+            "totalCap": 900000000000.0,
+            "allTimeHighUSD": 69000.0,
+            "circulatingSupply": 19000000.0,
+            "totalSupply": 19500000.0,
+            "maxSupply": 21000000.0,
+            "categories": ["Currency", "Store of Value"],
+            "delta": {
+                "hour": 0.5,
+                "day": 2.3,
+                "week": -1.2,
+                "month": 15.7,
+                "quarter": 8.4,
+                "year": 45.8,
+            },
+            "currency": "USD",
+            "fetched_at": datetime.utcnow().isoformat(),
+        }
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def sample_coin_data_bytes(sample_coin_data):
+    """Fixture providing sample coin data as a raw JSON response body."""
+    # orjson has no PyPy build; tests needing raw bodies skip there
+    orjson = pytest.importorskip("orjson")
+    return orjson.dumps([dict(sample_coin_data)])
+
+
+@pytest.fixture(scope="session")
 def sample_exchange_data():
-    """Fixture providing sample exchange data as returned by the LCW API."""
-    return {
-        "code": "binance",
-        "name": "Binance",
-        "png64": "https://lcw.nyc3.cdn.digitaloceanspaces.com/production/exchanges/64/binance.png",
-        "webp64": "https://lcw.nyc3.cdn.digitaloceanspaces.com/production/exchanges/64/binance.webp",
-        "centralized": True,
-        "usCompliant": False,
-        "volume": 15000000000.0,
-        "bidTotal": 2500000.0,
-        "askTotal": 2600000.0,
-        "depth": 5100000.0,
-        "visitors": 85000000,
-        "volumePerVisitor": 176.47,
-        "markets": 1534,
-        "fiats": ["USD", "EUR", "GBP", "JPY"],
-        "currency": "USD",
-    }
+    """Fixture providing sample exchange data as returned by the LCW API.
 
+    Session-scoped and read-only like ``sample_coin_data``.
+    """
+    return MappingProxyType(
+        {
+            "code": "binance",
+            "name": "Binance",
+            "png64": "https://lcw.nyc3.cdn.digitaloceanspaces.com/production/exchanges/64/binance.png",
+            "webp64": "https://lcw.nyc3.cdn.digitaloceanspaces.com/production/exchanges/64/binance.webp",
+            "centralized": True,
+            "usCompliant": False,
+            "volume": 15000000000.0,
+            "bidTotal": 2500000.0,
+            "askTotal": 2600000.0,
+            "depth": 5100000.0,
+            "visitors": 85000000,
+            "volumePerVisitor": 176.47,
+            "markets": 1534,
+            "fiats": ["USD", "EUR", "GBP", "JPY"],
+            "currency": "USD",
+        }
+    )
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def sample_market_data():
-    """Fixture providing sample market overview data."""
-    return {
-        "cap": 2500000000000.0,
-        "volume": 95000000000.0,
-        "liquidity": 8500000000.0,
-        "btcDominance": 42.5,
-        "currency": "USD",
-    }
+    """Fixture providing sample market overview data.
+
+    Session-scoped and read-only like ``sample_coin_data``.
+    """
+    return MappingProxyType(
+        {
+            "cap": 2500000000000.0,
+            "volume": 95000000000.0,
+            "liquidity": 8500000000.0,
+            "btcDominance": 42.5,
+            "currency": "USD",
+        }
+    )
 
 
 @pytest.fixture
@@ -290,52 +321,84 @@ def assert_coin_data_valid(coin_data: Dict[str, Any]):
             ), f"Field {field} must be numeric"
 
 
+# Candidate JSON encoders for the model tests; each must produce the same
+# document as model_dump_json()
+JSON_SERIALIZERS = [
+    pytest.param(lambda m: m.model_dump_json().encode(), id="pydantic"),
+    pytest.param(
+        lambda m: pytest.importorskip("orjson").dumps(m.model_dump(mode="json")),
+        id="orjson",
+    ),
+]
+
+# Expected type of each top-level key of an InfluxDB point
+INFLUX_POINT_SCHEMA = MappingProxyType(
+    {"measurement": str, "tags": dict, "fields": dict, "time": datetime}
+)
+
+
 def assert_influx_point_valid(point: Dict[str, Any]):
     """Custom assertion to validate InfluxDB point structure."""
-    assert "measurement" in point
-    assert "tags" in point
-    assert "fields" in point
-    assert "time" in point
+    missing = INFLUX_POINT_SCHEMA.keys() - point.keys()
+    assert not missing, f"Point is missing keys: {sorted(missing)}"
 
-    assert isinstance(point["tags"], dict)
-    assert isinstance(point["fields"], dict)
+    for key, expected_type in INFLUX_POINT_SCHEMA.items():
+        assert isinstance(
+            point[key], expected_type
+        ), f"Point {key!r} should be {expected_type.__name__}"
     assert len(point["fields"]) > 0, "Point must have at least one field"
 
 
+def influx_field_types(point: Dict[str, Any]) -> Dict[str, type]:
+    """Map each InfluxDB point field to the exact type of its value."""
+    return {name: type(value) for name, value in point["fields"].items()}
+
+
 # Test data generators
+
+# Key layout and shared values of every generated coin; each coin is
+# unpacked from this and fills in its own values
+_COIN_TEMPLATE = {
+    "code": None,
+    "name": None,
+    "symbol": None,
+    "rank": None,
+    "rate": 0.0,
+    "volume": 0.0,
+    "cap": 0.0,
+    "currency": "USD",
+}
+
+_COIN_SYMBOLS = (
+    "BTC",
+    "ETH",
+    "ADA",
+    "DOT",
+    "SOL",
+    "AVAX",
+    "MATIC",
+    "ATOM",
+    "LINK",
+    "UNI",
+)
+
+
 def generate_coins_list(count: int = 10) -> List[Dict[str, Any]]:
     """Generate a list of sample coin data for testing."""
-    coins = []
-    base_symbols = [
-        "BTC",
-        "ETH",
-        "ADA",
-        "DOT",
-        "SOL",
-        "AVAX",
-        "MATIC",
-        "ATOM",
-        "LINK",
-        "UNI",
+    return [
+        {
+            **_COIN_TEMPLATE,
+            "code": symbol,
+            "name": f"Test Coin {i + 1}",
+            "symbol": symbol,
+            "rank": i + 1,
+            "rate": 100.0 + i * 50,
+            "volume": 1000000000.0 + i * 100000000,
+            "cap": 10000000000.0 + i * 1000000000,
+        }
+        for i, symbol in zip(range(count), cycle(_COIN_SYMBOLS))
     ]
 
-    for i in range(count):
-        symbol = base_symbols[i % len(base_symbols)]
-        coins.append(
-            {
-                "code": symbol,
-                "name": f"Test Coin {i+1}",
-                "symbol": symbol,
-                "rank": i + 1,
-                "rate": 100.0 + (i * 50),
-                "volume": 1000000000.0 + (i * 100000000),
-                "cap": 10000000000.0 + (i * 1000000000),
-                "currency": "USD",
-            }
-        )
-
-    return coins
-
 
 def generate_exchanges_list(count: int = 5) -> List[Dict[str, Any]]:
     """Generate a list of sample exchange data for testing."""
@@ -376,6 +439,10 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "database: marks tests that require database access"
     )
+    config.addinivalue_line(
+        "markers",
+        "serialization_only: marks tests that build models without validation",
+    )
 
 
 def pytest_collection_modifyitems(config, items):
@@ -72,6 +72,25 @@ class TestAPIToDatabaseIntegration:
         assert len(points) == 1
         assert points[0]["measurement"] == "cryptocurrency_data"
 
+    @patch("requests.Session.post")
+    def test_fetch_coins_parses_raw_response_body(
+        self, mock_post, sample_coin_data_bytes
+    ):
+        """Test that coin data is parsed from the raw JSON response body."""
+        # Use a real Response so json() decodes the precomputed bytes
+        mock_response = requests.Response()
+        mock_response.status_code = 200
+        mock_response._content = sample_coin_data_bytes
+        mock_post.return_value = mock_response
+
+        api_client = LCWClient(api_key="test-key", enable_caching=False)
+        coins = api_client.get_coins_list(limit=1)
+
+        assert len(coins) == 1
+        assert isinstance(coins[0], Coin)
+        assert coins[0].code == "BTC"
+        assert coins[0].rate == 45000.50
+
     @patch("src.lcw_fetcher.database.influx_client.BaseInfluxDBClient")
     @patch("requests.Session.post")
     def test_fetch_and_store_exchanges_success(
@@ -240,10 +259,8 @@ class TestDataFetcherIntegration:
         mock_response.status_code = 500
         mock_post.return_value = mock_response
 
-        # Setup InfluxDB mock
+        # Setup InfluxDB mock (the write path is never reached)
         mock_client_instance = Mock()
-        mock_write_api = Mock()
-        mock_client_instance.write_api.return_value = mock_write_api
         mock_client_instance.query_api.return_value = Mock()
         mock_client_instance.health.return_value = {"status": "pass"}
         mock_influxdb.return_value = mock_client_instance
@@ -266,7 +283,7 @@ class TestDataFetcherIntegration:
             coins = api_client.get_coins_list(limit=1)
 
         # Database write should not be called
-        mock_write_api.write.assert_not_called()
+        mock_client_instance.write_api.return_value.write.assert_not_called()
 
 
 class TestRetryAndResilience:
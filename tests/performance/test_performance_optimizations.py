@@ -5,25 +5,149 @@ Performance optimization validation script for LCW Data Fetcher.
 This script tests and validates the performance improvements implemented
 in the optimization phases.
 """
+import argparse
+import cProfile
+import contextlib
 import json
+import logging
+import math
 import os
-import statistics
+import socket
 import sys
 import time
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Any, Dict, List
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlparse
 
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
+import numpy as np
+
+try:
+    from prometheus_client import CollectorRegistry, Gauge, write_to_textfile
+except ImportError:
+    CollectorRegistry = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from pyinstrument import Profiler
+except ImportError:
+    Profiler = None
 
-from lcw_fetcher.api.client import LCWClient
 from lcw_fetcher.fetcher import DataFetcher
-from lcw_fetcher.utils import Config
-from lcw_fetcher.utils.cache import clear_cache, get_cache_stats
-from lcw_fetcher.utils.performance_logger import (
-    get_performance_stats,
-    track_performance,
-)
+from lcw_fetcher.utils import Config, PerformanceContext, get_performance_stats
+from lcw_fetcher.utils.cache import api_cache
+
+logger = logging.getLogger("perf_validator")
+
+# API keys that mean no credentials were configured
+PLACEHOLDER_API_KEYS = frozenset({None, "", "your_api_key_here"})
+
+
+@dataclass(frozen=True, slots=True)
+class ValidatorSettings:
+    """Immutable snapshot of the configuration values the validator reads"""
+
+    api_key: str
+    api_url: str
+    influxdb_url: str
+
+    @classmethod
+    def from_config(cls, config: Config) -> "ValidatorSettings":
+        return cls(
+            api_key=config.lcw_api_key,
+            api_url=config.lcw_base_url,
+            influxdb_url=config.influxdb_url,
+        )
+
+
+def probe_endpoint(url: str, timeout: float = 0.5) -> Optional[str]:
+    """Open and close a TCP connection to url's host
+
+    Returns None when the endpoint accepts connections, otherwise the reason
+    it is unreachable. This is far cheaper than waiting out a client-level
+    connect timeout against a host that is down.
+    """
+    parsed = urlparse(url)
+    port = parsed.port or (443 if parsed.scheme == "https" else 80)
+    try:
+        socket.create_connection((parsed.hostname, port), timeout=timeout).close()
+    except OSError as e:
+        return str(e)
+    return None
+
+
+class Timer:
+    """Reusable perf_counter-based timer for the validation phases
+
+    Each completed ``with`` block is appended to ``samples`` and, when a
+    store is given, written to ``store[key]``. Blocks that raise are not
+    recorded.
+    """
+
+    def __init__(self, store: Dict[str, Any] = None, key: str = None):
+        self.store = store
+        self.key = key
+        self.samples: List[float] = []
+        self._start_time = None
+
+    def __enter__(self):
+        self._start_time = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            elapsed = time.perf_counter() - self._start_time
+            self.samples.append(elapsed)
+            if self.store is not None:
+                self.store[self.key] = elapsed
+        return False  # Don't suppress exceptions
+
+    @property
+    def last(self) -> float:
+        """Duration of the most recent timed block"""
+        return self.samples[-1]
+
+    def summary(self) -> Dict[str, float]:
+        """Robust statistics across all recorded samples"""
+        samples = np.sort(np.asarray(self.samples, dtype=np.float64))
+        # Drop the fastest and slowest 10% so one network stall can't skew
+        # the mean
+        trim = samples.size // 10
+        trimmed = samples[trim : samples.size - trim]
+        return {
+            "avg": float(samples.mean()),
+            "median": float(np.median(samples)),
+            "trimmed_mean": float(trimmed.mean()),
+            "p95": float(np.percentile(samples, 95)),
+            "min": float(samples[0]),
+            "max": float(samples[-1]),
+            "stdev": float(samples.std(ddof=1)) if samples.size > 1 else 0.0,
+        }
+
+
+def mann_whitney_less(x: List[float], y: List[float]) -> float:
+    """One-sided Mann-Whitney U p-value for x tending to be smaller than y
+
+    Uses the normal approximation with tie-averaged ranks and a continuity
+    correction, which is accurate at the sample sizes the validator takes
+    and avoids pulling in SciPy for a single test.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    combined = np.concatenate([x, y])
+    _, inverse, counts = np.unique(combined, return_inverse=True, return_counts=True)
+    # Tied values share the average of the ranks they span
+    ranks = (np.cumsum(counts) - (counts - 1) / 2)[inverse]
+    u = ranks[: x.size].sum() - x.size * (x.size + 1) / 2
+    mean = x.size * y.size / 2
+    sd = math.sqrt(x.size * y.size * (combined.size + 1) / 12)
+    z = (u - mean + 0.5) / sd
+    return 0.5 * math.erfc(-z / math.sqrt(2))
 
 
 class PerformanceValidator:
@@ -31,46 +155,120 @@ class PerformanceValidator:
 
     def __init__(self, config: Config):
         self.config = config
+        # Freeze the values read during the run so no phase can mutate them
+        self.settings = ValidatorSettings.from_config(config)
         self.results = {}
 
+        # Share one fetcher across all phases so the HTTP session and the
+        # database login are only paid for once
+        self.fetcher = DataFetcher(config)
+        self.connection_time = None
+        self.connection_error = None
+
+        # Without credentials only the in-process phases run, so skip the
+        # probes and the database login rather than paying for them
+        if self.settings.api_key in PLACEHOLDER_API_KEYS:
+            self.api_skip_reason = self.database_skip_reason = "no API key configured"
+            return
+
+        # Probe both endpoints up front so an unreachable service skips its
+        # phase instead of blocking on the client's connect timeout
+        self.api_skip_reason = probe_endpoint(self.settings.api_url)
+        self.database_skip_reason = probe_endpoint(self.settings.influxdb_url)
+
+        if self.database_skip_reason is None:
+            connect_timer = Timer()
+            try:
+                with connect_timer:
+                    self.fetcher.connect()
+                self.connection_time = connect_timer.last
+            except Exception as e:
+                self.connection_error = e
+
+    def close(self) -> None:
+        """Release the shared fetcher's connections"""
+        self.fetcher.close()
+
     def run_validation_suite(self) -> Dict[str, Any]:
         """Run complete performance validation suite"""
-        print("🚀 Starting Performance Optimization Validation")
-        print("=" * 60)
+        logger.info("🚀 Starting Performance Optimization Validation")
+        logger.info("=" * 60)
+
+        if self.settings.api_key in PLACEHOLDER_API_KEYS:
+            return self._skipped_results()
 
         results = {"timestamp": datetime.now().isoformat(), "tests": {}, "summary": {}}
 
         # Test 1: API Client Performance
-        print("\n📡 Testing API Client Performance...")
+        logger.info("📡 Testing API Client Performance...")
         results["tests"]["api_client"] = self.test_api_client_performance()
 
         # Test 2: Database Performance
-        print("\n💾 Testing Database Performance...")
+        logger.info("💾 Testing Database Performance...")
         results["tests"]["database"] = self.test_database_performance()
 
         # Test 3: Caching Effectiveness
-        print("\n🎯 Testing Caching Effectiveness...")
+        logger.info("🎯 Testing Caching Effectiveness...")
         results["tests"]["caching"] = self.test_caching_effectiveness()
 
         # Test 4: Full Fetch Cycle Performance
-        print("\n🔄 Testing Full Fetch Cycle Performance...")
+        logger.info("🔄 Testing Full Fetch Cycle Performance...")
         results["tests"]["full_cycle"] = self.test_full_cycle_performance()
 
         # Test 5: Performance Monitoring
-        print("\n📊 Testing Performance Monitoring...")
+        logger.info("📊 Testing Performance Monitoring...")
         results["tests"]["monitoring"] = self.test_performance_monitoring()
 
         # Generate summary
         results["summary"] = self.generate_summary(results["tests"])
 
-        print("\n✅ Performance Validation Complete!")
+        logger.info("✅ Performance Validation Complete!")
         return results
 
+    def _skipped_results(self) -> Dict[str, Any]:
+        """Results for a run without API credentials
+
+        Every API-backed phase would only measure 401 handling, so just the
+        in-process monitoring phase runs and the summary is flagged as
+        skipped rather than passed.
+        """
+        logger.warning("⏭️  No API key configured, skipping API-backed phases")
+        reason = "no API key configured"
+
+        logger.info("📊 Testing Performance Monitoring...")
+        monitoring = self.test_performance_monitoring()
+        tests = {
+            name: {"skipped": True, "reason": reason}
+            for name in ("api_client", "database", "caching", "full_cycle")
+        }
+        tests["monitoring"] = monitoring
+
+        passed = 1 if monitoring.get("tracking_active") else 0
+        summary = {
+            "total_tests": len(tests),
+            "passed_tests": passed,
+            "failed_tests": 1 - passed,
+            "warnings": 0,
+            "skipped": True,
+            "optimizations_verified": [],
+            "recommendations": ["Set LCW_API_KEY to run the full validation suite"],
+        }
+        if passed:
+            summary["optimizations_verified"].append(
+                "Performance monitoring and metrics collection"
+            )
+
+        return {
+            "timestamp": datetime.now().isoformat(),
+            "tests": tests,
+            "summary": summary,
+        }
+
     def test_api_client_performance(self) -> Dict[str, Any]:
         """Test API client performance improvements"""
-        print("  🔧 Testing enhanced timeout handling...")
-        print("  🔧 Testing retry logic and circuit breaker...")
-        print("  🔧 Testing connection pooling...")
+        logger.info("  🔧 Testing enhanced timeout handling...")
+        logger.info("  🔧 Testing retry logic and circuit breaker...")
+        logger.info("  🔧 Testing connection pooling...")
 
         results = {
             "timeout_handling": True,
@@ -80,48 +278,45 @@ class PerformanceValidator:
             "performance_metrics": {},
         }
 
-        try:
-            # Test API client initialization with new parameters
-            client = LCWClient(
-                api_key=self.config.lcw_api_key,
-                connect_timeout=5,
-                read_timeout=15,
-                max_retries=2,
-                enable_caching=True,
+        if self.api_skip_reason is not None:
+            logger.warning(
+                "    ⚠️  API unreachable, skipping: %s", self.api_skip_reason
             )
+            results["skipped"] = True
+            results["reason"] = self.api_skip_reason
+            return results
+
+        try:
+            client = self.fetcher.lcw_client
 
             # Test basic connectivity with timing
-            start_time = time.time()
             try:
-                status = client.check_status()
-                results["performance_metrics"]["status_check_time"] = (
-                    time.time() - start_time
-                )
-                print(
-                    f"    ✅ Status check: {results['performance_metrics']['status_check_time']:.2f}s"
+                with Timer(results["performance_metrics"], "status_check_time"):
+                    status = client.check_status()
+                logger.info(
+                    "    ✅ Status check: %.2fs",
+                    results["performance_metrics"]["status_check_time"],
                 )
             except Exception as e:
-                print(f"    ⚠️  Status check failed: {e}")
+                logger.warning("    ⚠️  Status check failed: %s", e)
                 results["timeout_handling"] = False
 
             # Test circuit breaker state
             breaker_state = client.circuit_breaker.state.value
             results["circuit_breaker_state"] = breaker_state
-            print(f"    ✅ Circuit breaker state: {breaker_state}")
-
-            client.close()
+            logger.info("    ✅ Circuit breaker state: %s", breaker_state)
 
         except Exception as e:
-            print(f"    ❌ API client test failed: {e}")
+            logger.error("    ❌ API client test failed: %s", e)
             results["timeout_handling"] = False
 
         return results
 
     def test_database_performance(self) -> Dict[str, Any]:
         """Test database performance improvements"""
-        print("  🔧 Testing connection handling...")
-        print("  🔧 Testing write optimization...")
-        print("  🔧 Testing batch processing...")
+        logger.info("  🔧 Testing connection handling...")
+        logger.info("  🔧 Testing write optimization...")
+        logger.info("  🔧 Testing batch processing...")
 
         results = {
             "connection_handling": True,
@@ -130,33 +325,41 @@ class PerformanceValidator:
             "performance_metrics": {},
         }
 
-        try:
-            fetcher = DataFetcher(self.config)
-
-            # Test database connection
-            start_time = time.time()
-            fetcher.connect()
-            results["performance_metrics"]["connection_time"] = time.time() - start_time
-            print(
-                f"    ✅ Database connection: {results['performance_metrics']['connection_time']:.2f}s"
+        if self.database_skip_reason is not None:
+            logger.warning(
+                "    ⚠️  Database unreachable, skipping: %s", self.database_skip_reason
             )
-
-            fetcher.close()
-
-        except Exception as e:
-            print(f"    ❌ Database test failed: {e}")
+            results["skipped"] = True
+            results["reason"] = self.database_skip_reason
+            return results
+
+        # The shared fetcher connected once in __init__; report that timing
+        if self.connection_error is None:
+            results["performance_metrics"]["connection_time"] = self.connection_time
+            logger.info(
+                "    ✅ Database connection: %.2fs",
+                results["performance_metrics"]["connection_time"],
+            )
+        else:
+            logger.error("    ❌ Database test failed: %s", self.connection_error)
             results["connection_handling"] = False
 
         return results
 
     def test_caching_effectiveness(self) -> Dict[str, Any]:
         """Test caching system effectiveness"""
-        print("  🔧 Testing cache implementation...")
-        print("  🔧 Testing cache hit rates...")
-        print("  🔧 Testing TTL configurations...")
+        logger.info("  🔧 Testing cache implementation...")
+        logger.info("  🔧 Testing cache hit rates...")
+        logger.info("  🔧 Testing TTL configurations...")
+
+        if self.api_skip_reason is not None:
+            logger.warning(
+                "    ⚠️  API unreachable, skipping: %s", self.api_skip_reason
+            )
+            return {"skipped": True, "reason": self.api_skip_reason}
 
-        # Clear cache to start fresh
-        clear_cache()
+        # Clear the client's response cache to start fresh
+        api_cache.clear()
 
         results = {
             "cache_implementation": True,
@@ -166,52 +369,94 @@ class PerformanceValidator:
         }
 
         try:
-            fetcher = DataFetcher(self.config)
+            fetcher = self.fetcher
 
-            # First call - should be a cache miss
-            start_time = time.time()
-            status1 = fetcher.check_api_status()
-            first_call_time = time.time() - start_time
+            metrics = results["performance_metrics"]
 
-            # Second call - should be a cache hit
-            start_time = time.time()
-            status2 = fetcher.check_api_status()
-            second_call_time = time.time() - start_time
-
-            results["performance_metrics"]["first_call_time"] = first_call_time
-            results["performance_metrics"]["second_call_time"] = second_call_time
-
-            if second_call_time < first_call_time * 0.5:  # 50% improvement expected
+            # Warm up the connection pool with a bodiless HEAD first so neither
+            # timed call pays the TCP/TLS handshake; that cost is recorded on
+            # its own as handshake_time and the cache check below only looks
+            # at the response cache
+            client = fetcher.lcw_client
+            try:
+                with Timer(metrics, "handshake_time"):
+                    client.session.head(f"{client.base_url}/status", timeout=2)
+            except Exception as e:
+                logger.warning("    ⚠️  Connection warm-up failed: %s", e)
+            api_cache.clear()
+
+            # A single miss/hit pair is at the mercy of scheduler jitter, so
+            # take repeated samples and test whether hits are faster. The
+            # client is called directly: the fetcher's rate limiter would add
+            # up to a second to every hit, so it is applied untimed before
+            # each miss instead. Each sample therefore waits out one rate
+            # limit interval (1s at the default 60 requests per minute), so
+            # PERF_CACHE_SAMPLES adds about that many seconds to a run
+            samples = int(os.getenv("PERF_CACHE_SAMPLES", "10"))
+            first_timer, second_timer = Timer(), Timer()
+            for _ in range(samples):
+                api_cache.clear()
+                fetcher.rate_limit()
+                with first_timer:
+                    client.check_status()
+                with second_timer:
+                    client.check_status()
+
+            first_call_time = float(np.median(first_timer.samples))
+            second_call_time = float(np.median(second_timer.samples))
+            p_value = mann_whitney_less(second_timer.samples, first_timer.samples)
+            metrics["first_call_time"] = first_call_time
+            metrics["second_call_time"] = second_call_time
+            metrics["cache_delta"] = first_call_time - second_call_time
+            metrics["p_value"] = p_value
+
+            if p_value < 0.01:
                 results["hit_rate_improvement"] = True
-                print(
-                    f"    ✅ Cache performance: {first_call_time:.3f}s → {second_call_time:.3f}s"
+                logger.info(
+                    "    ✅ Cache performance: %.3fs → %.3fs (p=%.2g)",
+                    first_call_time,
+                    second_call_time,
+                    p_value,
                 )
             else:
-                print(
-                    f"    ⚠️  Cache performance: {first_call_time:.3f}s → {second_call_time:.3f}s"
+                logger.warning(
+                    "    ⚠️  Cache performance: %.3fs → %.3fs (p=%.2g)",
+                    first_call_time,
+                    second_call_time,
+                    p_value,
                 )
 
             # Get cache statistics
-            cache_stats = get_cache_stats()
+            cache_stats = api_cache.get_stats()
             results["cache_stats"] = cache_stats
 
+            # The full cycle phase deliberately reuses this warm cache, as a
+            # long-running fetcher would, so make sure it was populated
             if cache_stats["total_requests"] > 0:
-                print(
-                    f"    ✅ Cache statistics: {cache_stats['hit_rate_percent']:.1f}% hit rate"
+                logger.info(
+                    "    ✅ Cache statistics: %.1f%% hit rate",
+                    cache_stats["hit_rate_percent"],
                 )
-
-            fetcher.close()
+            else:
+                logger.error("    ❌ API response cache saw no lookups")
+                results["cache_implementation"] = False
 
         except Exception as e:
-            print(f"    ❌ Caching test failed: {e}")
+            logger.error("    ❌ Caching test failed: %s", e)
             results["cache_implementation"] = False
 
         return results
 
     def test_full_cycle_performance(self) -> Dict[str, Any]:
         """Test full fetch cycle performance"""
-        print("  🔧 Testing complete data fetch cycle...")
-        print("  🔧 Testing performance tracking...")
+        logger.info("  🔧 Testing complete data fetch cycle...")
+        logger.info("  🔧 Testing performance tracking...")
+
+        if self.api_skip_reason is not None:
+            logger.warning(
+                "    ⚠️  API unreachable, skipping: %s", self.api_skip_reason
+            )
+            return {"skipped": True, "reason": self.api_skip_reason}
 
         results = {
             "cycle_completion": True,
@@ -219,60 +464,69 @@ class PerformanceValidator:
             "performance_metrics": {},
         }
 
-        cycle_times = []
+        cycle_timer = Timer()
 
         try:
-            fetcher = DataFetcher(self.config)
+            # Run multiple fetch cycles to get average performance. Each cycle
+            # still waits out the rate limit before both of its requests
+            # (~2s at 60 rpm), so the default takes about 40s; lower
+            # PERF_CYCLES for quick runs
+            num_cycles = int(os.getenv("PERF_CYCLES", "20"))
 
-            # Run multiple fetch cycles to get average performance
-            num_cycles = 3
-            print(f"    Running {num_cycles} test cycles...")
+            logger.info("    Running %s test cycles...", num_cycles)
 
+            client = self.fetcher.lcw_client
+            call_timer = Timer()
             for i in range(num_cycles):
-                start_time = time.time()
-
-                # Use a lightweight test - just check status and credits
                 try:
-                    status = fetcher.check_api_status()
-                    credits = fetcher.get_api_credits()
-                    cycle_time = time.time() - start_time
-                    cycle_times.append(cycle_time)
-                    print(f"      Cycle {i+1}: {cycle_time:.2f}s")
+                    # Rate limit outside the timer so the statistics measure
+                    # request latency rather than the limiter's sleep
+                    self.fetcher.rate_limit()
+                    with call_timer:
+                        client.check_status()
+                    self.fetcher.rate_limit()
+                    with call_timer:
+                        client.get_credits()
+                    cycle_timer.samples.append(sum(call_timer.samples[-2:]))
+                    logger.info("      Cycle %s: %.2fs", i + 1, cycle_timer.last)
                 except Exception as e:
-                    print(f"      Cycle {i+1} failed: {e}")
+                    logger.info("      Cycle %s failed: %s", i + 1, e)
                     results["cycle_completion"] = False
 
-            if cycle_times:
-                results["performance_metrics"]["avg_cycle_time"] = statistics.mean(
-                    cycle_times
-                )
-                results["performance_metrics"]["min_cycle_time"] = min(cycle_times)
-                results["performance_metrics"]["max_cycle_time"] = max(cycle_times)
-
-                print(
-                    f"    ✅ Average cycle time: {results['performance_metrics']['avg_cycle_time']:.2f}s"
+            if cycle_timer.samples:
+                cycle_stats = cycle_timer.summary()
+                metrics = results["performance_metrics"]
+                # Median is far more stable than the mean at these sample sizes
+                metrics["avg_cycle_time"] = cycle_stats["median"]
+                metrics["trimmed_mean_cycle_time"] = cycle_stats["trimmed_mean"]
+                metrics["p95_cycle_time"] = cycle_stats["p95"]
+                metrics["min_cycle_time"] = cycle_stats["min"]
+                metrics["max_cycle_time"] = cycle_stats["max"]
+                metrics["stdev_cycle_time"] = cycle_stats["stdev"]
+
+                logger.info(
+                    "    ✅ Average cycle time: %.2fs",
+                    results["performance_metrics"]["avg_cycle_time"],
                 )
 
                 # Check if performance is within acceptable range (< 30s for status checks)
                 if results["performance_metrics"]["avg_cycle_time"] < 10.0:
-                    print("    ✅ Performance within excellent range (<10s)")
+                    logger.info("    ✅ Performance within excellent range (<10s)")
                 elif results["performance_metrics"]["avg_cycle_time"] < 30.0:
-                    print("    ✅ Performance within acceptable range (<30s)")
+                    logger.info("    ✅ Performance within acceptable range (<30s)")
                 else:
-                    print("    ⚠️  Performance slower than expected (>30s)")
-
-            fetcher.close()
+                    logger.warning("    ⚠️  Performance slower than expected (>30s)")
 
         except Exception as e:
-            print(f"    ❌ Full cycle test failed: {e}")
+            logger.error("    ❌ Full cycle test failed: %s", e)
             results["cycle_completion"] = False
 
         return results
 
     def test_performance_monitoring(self) -> Dict[str, Any]:
         """Test performance monitoring capabilities"""
-        print("  🔧 Testing performance tracking...")
-        print("  🔧 Testing metric collection...")
+        logger.info("  🔧 Testing performance tracking...")
+        logger.info("  🔧 Testing metric collection...")
 
         results = {
             "tracking_active": True,
@@ -282,7 +536,7 @@ class PerformanceValidator:
 
         try:
             # Test performance tracking context manager
-            with track_performance("test_operation"):
+            with PerformanceContext("test_operation"):
                 time.sleep(0.1)  # Simulate work
 
             # Get performance statistics
@@ -290,14 +544,15 @@ class PerformanceValidator:
 
             if "error" not in perf_stats:
                 results["performance_metrics"]["perf_stats"] = perf_stats
-                print(
-                    f"    ✅ Performance stats collected: {perf_stats.get('count', 0)} operations"
+                logger.info(
+                    "    ✅ Performance stats collected: %s operations",
+                    perf_stats.get("count", 0),
                 )
             else:
-                print(f"    📊 Performance stats: {perf_stats['error']}")
+                logger.info("    📊 Performance stats: %s", perf_stats["error"])
 
         except Exception as e:
-            print(f"    ❌ Performance monitoring test failed: {e}")
+            logger.error("    ❌ Performance monitoring test failed: %s", e)
             results["tracking_active"] = False
 
         return results
@@ -313,37 +568,43 @@ class PerformanceValidator:
             "recommendations": [],
         }
 
-        print("\n📋 Validation Summary:")
-        print("=" * 40)
+        logger.info("📋 Validation Summary:")
+        logger.info("=" * 40)
 
         # Analyze API client results
         api_results = test_results.get("api_client", {})
-        if api_results.get("timeout_handling") and api_results.get("retry_logic"):
+        if api_results.get("skipped"):
+            summary["warnings"] += 1
+            logger.warning("  ⚠️  API Client Optimizations: SKIPPED (unreachable)")
+        elif api_results.get("timeout_handling") and api_results.get("retry_logic"):
             summary["passed_tests"] += 1
             summary["optimizations_verified"].append(
                 "Enhanced API client with timeouts and retries"
             )
-            print("  ✅ API Client Optimizations: VERIFIED")
+            logger.info("  ✅ API Client Optimizations: VERIFIED")
         else:
             summary["failed_tests"] += 1
-            print("  ❌ API Client Optimizations: FAILED")
+            logger.error("  ❌ API Client Optimizations: FAILED")
 
         # Analyze caching results
         cache_results = test_results.get("caching", {})
-        if cache_results.get("cache_implementation") and cache_results.get(
+        if cache_results.get("skipped"):
+            summary["warnings"] += 1
+            logger.warning("  ⚠️  Caching System: SKIPPED (unreachable)")
+        elif cache_results.get("cache_implementation") and cache_results.get(
             "hit_rate_improvement"
         ):
             summary["passed_tests"] += 1
             summary["optimizations_verified"].append(
                 "Response caching with hit rate improvement"
             )
-            print("  ✅ Caching System: VERIFIED")
+            logger.info("  ✅ Caching System: VERIFIED")
         else:
             summary["warnings"] += 1
             summary["recommendations"].append(
                 "Monitor cache hit rates and tune TTL values"
             )
-            print("  ⚠️  Caching System: NEEDS MONITORING")
+            logger.warning("  ⚠️  Caching System: NEEDS MONITORING")
 
         # Analyze performance monitoring
         monitoring_results = test_results.get("monitoring", {})
@@ -352,23 +613,23 @@ class PerformanceValidator:
             summary["optimizations_verified"].append(
                 "Performance monitoring and metrics collection"
             )
-            print("  ✅ Performance Monitoring: VERIFIED")
+            logger.info("  ✅ Performance Monitoring: VERIFIED")
         else:
             summary["failed_tests"] += 1
-            print("  ❌ Performance Monitoring: FAILED")
+            logger.error("  ❌ Performance Monitoring: FAILED")
 
         # Overall assessment
-        print(f"\n🎯 Overall Results:")
-        print(f"   Passed: {summary['passed_tests']}")
-        print(f"   Warnings: {summary['warnings']}")
-        print(f"   Failed: {summary['failed_tests']}")
+        logger.info("🎯 Overall Results:")
+        logger.info("   Passed: %s", summary["passed_tests"])
+        logger.info("   Warnings: %s", summary["warnings"])
+        logger.info("   Failed: %s", summary["failed_tests"])
 
         if summary["failed_tests"] == 0:
-            print("  ✅ All critical optimizations verified!")
+            logger.info("  ✅ All critical optimizations verified!")
         elif summary["failed_tests"] <= summary["passed_tests"]:
-            print("  ⚠️  Most optimizations working, some issues detected")
+            logger.warning("  ⚠️  Most optimizations working, some issues detected")
         else:
-            print("  ❌ Significant optimization issues detected")
+            logger.error("  ❌ Significant optimization issues detected")
 
         return summary
 
@@ -378,45 +639,166 @@ class PerformanceValidator:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"performance_validation_{timestamp}.json"
 
-        with open(filename, "w") as f:
-            json.dump(results, f, indent=2, default=str)
+        if orjson is not None:
+            Path(filename).write_bytes(
+                orjson.dumps(results, default=str, option=orjson.OPT_INDENT_2)
+            )
+        else:
+            with open(filename, "w") as f:
+                json.dump(results, f, indent=2, default=str)
+
+        logger.info("💾 Results saved to: %s", filename)
 
-        print(f"\n💾 Results saved to: {filename}")
+        # OpenMetrics text alongside the JSON so runs can be scraped and
+        # compared over time without parsing timestamped filenames
+        if CollectorRegistry is not None:
+            metrics_filename = str(Path(filename).with_suffix(".prom"))
+            write_to_textfile(metrics_filename, build_metrics_registry(results))
+            logger.info("📈 Metrics saved to: %s", metrics_filename)
+        else:
+            logger.info("📈 prometheus_client not installed, skipping metrics export")
+
+        return filename
+
+
+def build_metrics_registry(results: Dict[str, Any]) -> "CollectorRegistry":
+    """Expose the headline validation metrics as Prometheus gauges"""
+    registry = CollectorRegistry()
+    tests = results["tests"]
+
+    cycle_metrics = tests.get("full_cycle", {}).get("performance_metrics", {})
+    cycle_gauge = Gauge(
+        "lcw_perf_cycle_seconds",
+        "Full fetch cycle duration",
+        ["stat"],
+        registry=registry,
+    )
+    for stat in ("avg", "trimmed_mean", "p95", "min", "max", "stdev"):
+        value = cycle_metrics.get(f"{stat}_cycle_time")
+        if value is not None:
+            cycle_gauge.labels(stat=stat).set(value)
+
+    cache_results = tests.get("caching", {})
+    cache_metrics = cache_results.get("performance_metrics", {})
+    cache_call_gauge = Gauge(
+        "lcw_perf_cache_call_seconds",
+        "API status call duration by cache state",
+        ["call"],
+        registry=registry,
+    )
+    for call in ("first", "second"):
+        value = cache_metrics.get(f"{call}_call_time")
+        if value is not None:
+            cache_call_gauge.labels(call=call).set(value)
+
+    cache_stats = cache_results.get("cache_stats")
+    if cache_stats:
+        Gauge(
+            "lcw_perf_cache_hit_ratio",
+            "API response cache hit ratio",
+            registry=registry,
+        ).set(cache_stats["hit_rate_percent"] / 100)
+
+    single_metrics = {
+        "lcw_perf_status_check_seconds": (
+            "api_client",
+            "status_check_time",
+            "API status check duration",
+        ),
+        "lcw_perf_db_connection_seconds": (
+            "database",
+            "connection_time",
+            "Database connection duration",
+        ),
+        "lcw_perf_handshake_seconds": (
+            "caching",
+            "handshake_time",
+            "HTTP connection warm-up duration",
+        ),
+    }
+    for name, (test_name, metric_key, documentation) in single_metrics.items():
+        value = tests.get(test_name, {}).get("performance_metrics", {}).get(metric_key)
+        if value is not None:
+            Gauge(name, documentation, registry=registry).set(value)
+
+    return registry
+
+
+def create_profiler():
+    """Sampling profiler for the whole suite, falling back to cProfile"""
+    if Profiler is not None:
+        return Profiler(interval=0.001, async_mode="disabled")
+    return cProfile.Profile()
+
+
+def save_profile(profiler, results_filename: str) -> None:
+    """Save profiler output next to the results file"""
+    if Profiler is not None and isinstance(profiler, Profiler):
+        path = Path(results_filename).with_suffix(".html")
+        path.write_text(profiler.output_html())
+    else:
+        path = Path(results_filename).with_suffix(".prof")
+        profiler.dump_stats(path)
+
+    logger.info("🔥 Profile saved to: %s", path)
 
 
 def main():
     """Main validation script"""
-    print("🔍 LCW Performance Optimization Validator")
-    print("Version: 1.0")
-    print("=" * 60)
+    parser = argparse.ArgumentParser(
+        description="Validate LCW Data Fetcher performance optimizations"
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Profile the whole suite and save the report next to the results",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO, format="%(message)s", handlers=[logging.StreamHandler()]
+    )
+
+    logger.info("🔍 LCW Performance Optimization Validator")
+    logger.info("Version: 1.0")
+    logger.info("=" * 60)
 
     try:
         # Load configuration
         config = Config()
-        print(f"✅ Configuration loaded successfully")
+        logger.info("✅ Configuration loaded successfully")
 
         # Check if we have API credentials
-        if not config.lcw_api_key or config.lcw_api_key == "your_api_key_here":
-            print("⚠️  Warning: Using demo mode - some tests may be limited")
-            print("   Set LCW_API_KEY environment variable for full testing")
-
-        # Run validation
-        validator = PerformanceValidator(config)
-        results = validator.run_validation_suite()
+        if config.lcw_api_key in PLACEHOLDER_API_KEYS:
+            logger.warning("⚠️  Warning: Using demo mode - only monitoring is tested")
+            logger.info("   Set LCW_API_KEY environment variable for full testing")
+
+        # Run validation; the stack stops the profiler and then releases the
+        # shared fetcher's connections whether or not the suite raises
+        profiler = create_profiler() if args.profile else None
+        with contextlib.ExitStack() as stack:
+            validator = stack.enter_context(
+                contextlib.closing(PerformanceValidator(config))
+            )
+            if profiler is not None:
+                stack.enter_context(profiler)
+            results = validator.run_validation_suite()
 
         # Save results
-        validator.save_results(results)
+        filename = validator.save_results(results)
+        if profiler is not None:
+            save_profile(profiler, filename)
 
         # Print final recommendations
         if results["summary"]["recommendations"]:
-            print("\n💡 Recommendations:")
+            logger.info("💡 Recommendations:")
             for rec in results["summary"]["recommendations"]:
-                print(f"   • {rec}")
+                logger.info("   • %s", rec)
 
-        print("\n🎉 Validation Complete!")
+        logger.info("🎉 Validation Complete!")
 
     except Exception as e:
-        print(f"❌ Validation failed: {e}")
+        logger.error("❌ Validation failed: %s", e)
         sys.exit(1)
 
 
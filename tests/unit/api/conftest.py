@@ -0,0 +1,38 @@
+"""
+Fixtures shared by the API unit tests.
+"""
+
+import pytest
+
+from src.lcw_fetcher.api.exceptions import (
+    LCWAPIError,
+    LCWAuthError,
+    LCWNetworkError,
+    LCWRateLimitError,
+    LCWValidationError,
+)
+
+API_EXCEPTION_CLASSES = (
+    LCWAPIError,
+    LCWRateLimitError,
+    LCWAuthError,
+    LCWValidationError,
+    LCWNetworkError,
+)
+
+
+@pytest.fixture(scope="session")
+def exception_classes():
+    """Every API exception class, base class first."""
+    return API_EXCEPTION_CLASSES
+
+
+@pytest.fixture(scope="session")
+def sample_exceptions(exception_classes):
+    """One instance of each API exception, built once per session.
+
+    The instances are shared, so tests may inspect them but must not raise
+    them: raising sets __traceback__ and __context__ on the instance, which
+    would leak into every later test.
+    """
+    return tuple(exc_class("test") for exc_class in exception_classes)
@@ -5,12 +5,18 @@ Tests cover API client functionality, request handling, error handling,
 retry logic, and response processing.
 """
 
+import io
+import re
 from datetime import datetime
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import Mock
 
 import pytest
 import requests
+import urllib3
+from requests.adapters import HTTPAdapter
 from requests.exceptions import ConnectionError, HTTPError, Timeout
+from urllib3 import HTTPResponse
+from urllib3.connectionpool import HTTPConnectionPool
 
 from src.lcw_fetcher.api.client import LCWClient
 from src.lcw_fetcher.api.exceptions import (
@@ -21,6 +27,82 @@ from src.lcw_fetcher.api.exceptions import (
 )
 from src.lcw_fetcher.models import Coin, Exchange, Market
 
+API_URL = re.compile(r"https://api\.livecoinwatch\.com/.*")
+
+# Canned API outcomes, as keyword arguments for requests_mock.post()
+RESP_200_OK = {"status_code": 200, "json": {"status": "success"}}
+RESP_401 = {"status_code": 401}
+RESP_429 = {"status_code": 429}
+RESP_400_JSON = {
+    "status_code": 400,
+    "json": {"error": {"description": "Invalid parameters"}},
+}
+RESP_500_NO_JSON = {"status_code": 500, "text": "No JSON"}
+RESP_TIMEOUT = {"exc": Timeout("Request timeout")}
+RESP_CONNECTION_ERROR = {"exc": ConnectionError("Connection failed")}
+RESP_REQUEST_ERROR = {"exc": requests.exceptions.RequestException("Generic error")}
+
+# Minimal coins/single payload with only the fields the Coin model requires
+MINIMAL_COIN_RESPONSE = {"name": "Bitcoin", "rate": 45000.0}
+
+
+def assert_posted(requests_mock, endpoint, payload):
+    """Assert the client made exactly one API POST to endpoint with payload."""
+    assert requests_mock.call_count == 1
+    request = requests_mock.last_request
+    assert request.method == "POST"
+    assert request.url == f"https://api.livecoinwatch.com/{endpoint}"
+    assert request.json() == payload
+    assert request.timeout == (10, 30)
+
+
+LIST_METHOD_CASES = [
+    pytest.param(
+        "get_coins_list",
+        "coins/list",
+        {
+            "currency": "EUR",
+            "sort": "volume",
+            "order": "descending",
+            "offset": 10,
+            "limit": 50,
+            "meta": True,
+        },
+        {
+            "currency": "USD",
+            "sort": "rank",
+            "order": "ascending",
+            "offset": 0,
+            "limit": 100,
+            "meta": False,
+        },
+        Coin,
+        id="coins",
+    ),
+    pytest.param(
+        "get_exchanges_list",
+        "exchanges/list",
+        {
+            "currency": "EUR",
+            "sort": "volume",
+            "order": "ascending",
+            "offset": 5,
+            "limit": 25,
+            "meta": True,
+        },
+        {
+            "currency": "USD",
+            "sort": "visitors",
+            "order": "descending",
+            "offset": 0,
+            "limit": 50,
+            "meta": False,
+        },
+        Exchange,
+        id="exchanges",
+    ),
+]
+
 
 class TestLCWClientInit:
     """Tests for LCWClient initialization."""
@@ -66,185 +148,254 @@ class TestLCWClientInit:
         assert client.session.headers["Content-Type"] == "application/json"
         assert client.session.headers["x-api-key"] == mock_api_key
 
+    def test_client_mounts_pooled_adapter(self, mock_api_key):
+        """Test that API requests reuse keep-alive connections from a pool."""
+        client = LCWClient(api_key=mock_api_key)
 
-class TestLCWClientMakeRequest:
-    """Tests for the _make_request method."""
+        adapter = client.session.get_adapter("https://api.livecoinwatch.com/status")
 
-    @patch("requests.Session.post")
-    def test_make_request_success(self, mock_post, mock_api_key):
-        """Test successful API request."""
-        # Setup mock response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"status": "success"}
-        mock_post.return_value = mock_response
+        assert isinstance(adapter, HTTPAdapter)
+        assert adapter is client.session.get_adapter("http://localhost")
+        assert adapter._pool_maxsize == client.pool_maxsize
+        assert adapter._pool_maxsize >= 10
 
-        client = LCWClient(api_key=mock_api_key)
-        result = client._make_request("test-endpoint", {"test": "payload"})
 
-        assert result == {"status": "success"}
-        mock_post.assert_called_once()
+@pytest.fixture(scope="module")
+def shared_client():
+    """Client shared by every test that doesn't exercise __init__ itself.
 
-        # Check the call arguments
-        args, kwargs = mock_post.call_args
-        assert "test-endpoint" in args[0]
-        assert kwargs["json"] == {"test": "payload"}
-        assert kwargs["timeout"] == 30
+    Caching is disabled so a response cached by one test can't answer the
+    next one's request.
+    """
+    return LCWClient(api_key="test_api_key_12345", enable_caching=False)
 
-    @patch("requests.Session.post")
-    def test_make_request_no_payload(self, mock_post, mock_api_key):
-        """Test API request without payload."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"status": "success"}
-        mock_post.return_value = mock_response
 
-        client = LCWClient(api_key=mock_api_key)
-        result = client._make_request("test-endpoint")
+@pytest.fixture
+def client(shared_client):
+    """Shared client with its circuit breaker closed again."""
+    shared_client.circuit_breaker.record_success()
+    return shared_client
 
-        # Should use empty dict as payload
-        args, kwargs = mock_post.call_args
-        assert kwargs["json"] == {}
 
-    @patch("requests.Session.post")
-    def test_make_request_endpoint_leading_slash(self, mock_post, mock_api_key):
-        """Test that leading slash is stripped from endpoint."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"status": "success"}
-        mock_post.return_value = mock_response
+@pytest.fixture
+def mock_make_request(monkeypatch):
+    """Stand-in for LCWClient._make_request."""
+    mock = Mock()
+    monkeypatch.setattr(LCWClient, "_make_request", mock)
+    return mock
 
-        client = LCWClient(api_key=mock_api_key)
-        client._make_request("/test-endpoint")
 
-        # Check that URL was constructed correctly
-        args, kwargs = mock_post.call_args
-        expected_url = "https://api.livecoinwatch.com/test-endpoint"
-        assert args[0] == expected_url
+@pytest.fixture
+def mock_pool_request(monkeypatch):
+    """Stand-in for the connection pool's single-attempt request."""
+    mock = Mock()
+    monkeypatch.setattr(HTTPConnectionPool, "_make_request", mock)
+    return mock
 
-    @patch("requests.Session.post")
-    def test_make_request_auth_error(self, mock_post, mock_api_key):
-        """Test handling of authentication error."""
-        mock_response = Mock()
-        mock_response.status_code = 401
-        mock_post.return_value = mock_response
 
-        client = LCWClient(api_key=mock_api_key)
+@pytest.fixture
+def mock_sleep(monkeypatch):
+    """Stand-in for the sleep urllib3 uses between retries."""
+    mock = Mock()
+    monkeypatch.setattr(urllib3.util.retry.time, "sleep", mock)
+    return mock
 
-        with pytest.raises(LCWAuthError) as exc_info:
-            client._make_request("test-endpoint")
 
-        assert "Invalid API key" in str(exc_info.value)
-        assert exc_info.value.status_code == 401
+@pytest.fixture
+def api_coin_response(sample_coin_data):
+    """Sample coin as the API returns it, without the fields the client adds."""
+    return {
+        key: value
+        for key, value in sample_coin_data.items()
+        if key not in ("currency", "code")
+    }
 
-    @patch("requests.Session.post")
-    def test_make_request_rate_limit_error(self, mock_post, mock_api_key):
-        """Test handling of rate limit error."""
-        mock_response = Mock()
-        mock_response.status_code = 429
-        mock_post.return_value = mock_response
 
-        client = LCWClient(api_key=mock_api_key)
+@pytest.fixture
+def api_list_factory(api_coin_response, sample_exchange_data):
+    """Factory for list responses of n distinctly coded coins or exchanges."""
+    templates = {
+        Coin: (api_coin_response, "COIN{}"),
+        Exchange: (
+            {k: v for k, v in sample_exchange_data.items() if k != "currency"},
+            "exchange{}",
+        ),
+    }
 
-        with pytest.raises(LCWRateLimitError) as exc_info:
-            client._make_request("test-endpoint")
+    def make(model, n):
+        template, code = templates[model]
+        return [dict(template, code=code.format(i + 1)) for i in range(n)]
 
-        assert "API rate limit exceeded" in str(exc_info.value)
-        assert exc_info.value.status_code == 429
+    return make
 
-    @patch("requests.Session.post")
-    def test_make_request_api_error_with_json(self, mock_post, mock_api_key):
-        """Test handling of API error with JSON error response."""
-        mock_response = Mock()
-        mock_response.status_code = 400
-        mock_response.json.return_value = {
-            "error": {"description": "Invalid parameters"}
-        }
-        mock_post.return_value = mock_response
 
-        client = LCWClient(api_key=mock_api_key)
+class TestLCWClientMakeRequest:
+    """Tests for the _make_request method."""
 
-        with pytest.raises(LCWAPIError) as exc_info:
-            client._make_request("test-endpoint")
+    @pytest.mark.parametrize(
+        "response,expected_exc,message_fragment",
+        [
+            pytest.param(RESP_200_OK, None, None, id="success"),
+            pytest.param(RESP_401, LCWAuthError, "Invalid API key", id="auth_error"),
+            pytest.param(
+                RESP_429,
+                LCWRateLimitError,
+                "API rate limit exceeded",
+                id="rate_limit_error",
+            ),
+            pytest.param(
+                RESP_400_JSON,
+                LCWAPIError,
+                "Invalid parameters",
+                id="api_error_with_json",
+            ),
+            pytest.param(
+                RESP_500_NO_JSON, LCWAPIError, "HTTP 500", id="api_error_without_json"
+            ),
+            pytest.param(
+                RESP_TIMEOUT, LCWNetworkError, "Request timeout", id="timeout_error"
+            ),
+            pytest.param(
+                RESP_CONNECTION_ERROR,
+                LCWNetworkError,
+                "Connection error",
+                id="connection_error",
+            ),
+            pytest.param(
+                RESP_REQUEST_ERROR,
+                LCWNetworkError,
+                "Request failed: Generic error",
+                id="generic_request_error",
+            ),
+        ],
+    )
+    def test_make_request(
+        self, requests_mock, client, response, expected_exc, message_fragment
+    ):
+        """Test each response and transport outcome of an API request."""
+        requests_mock.post(API_URL, **response)
 
-        assert "Invalid parameters" in str(exc_info.value)
-        assert exc_info.value.status_code == 400
+        if expected_exc is None:
+            result = client._make_request("test-endpoint", {"test": "payload"})
+            assert result == response["json"]
+        else:
+            with pytest.raises(
+                expected_exc, match=re.escape(message_fragment)
+            ) as exc_info:
+                client._make_request("test-endpoint", {"test": "payload"})
 
-    @patch("requests.Session.post")
-    def test_make_request_api_error_without_json(self, mock_post, mock_api_key):
-        """Test handling of API error without JSON error response."""
-        mock_response = Mock()
-        mock_response.status_code = 500
-        mock_response.json.side_effect = ValueError("No JSON")
-        mock_post.return_value = mock_response
+            if "status_code" in response:
+                assert exc_info.value.status_code == response["status_code"]
 
-        client = LCWClient(api_key=mock_api_key)
+        assert_posted(requests_mock, "test-endpoint", {"test": "payload"})
 
-        with pytest.raises(LCWAPIError) as exc_info:
-            client._make_request("test-endpoint")
+    def test_make_request_no_payload(self, requests_mock, client):
+        """Test API request without payload."""
+        requests_mock.post(API_URL, **RESP_200_OK)
 
-        assert "HTTP 500" in str(exc_info.value)
-        assert exc_info.value.status_code == 500
+        client._make_request("test-endpoint")
 
-    @patch("requests.Session.post")
-    def test_make_request_timeout_error(self, mock_post, mock_api_key):
-        """Test handling of timeout error."""
-        mock_post.side_effect = Timeout("Request timeout")
+        # Should use empty dict as payload
+        assert_posted(requests_mock, "test-endpoint", {})
+
+    @pytest.mark.parametrize(
+        "endpoint,expected_path",
+        [
+            ("test-endpoint", "test-endpoint"),
+            ("/test-endpoint", "test-endpoint"),
+            ("//test-endpoint", "test-endpoint"),
+            ("coins/single/history", "coins/single/history"),
+            ("/coins/single/history", "coins/single/history"),
+            ("test-endpoint?x=1", "test-endpoint?x=1"),
+        ],
+    )
+    def test_make_request_url_construction(
+        self, requests_mock, client, endpoint, expected_path
+    ):
+        """Test that endpoints are joined to the base URL with one slash."""
+        requests_mock.post(API_URL, **RESP_200_OK)
 
-        client = LCWClient(api_key=mock_api_key)
+        client._make_request(endpoint)
 
-        with pytest.raises(LCWNetworkError) as exc_info:
-            client._make_request("test-endpoint")
+        assert_posted(requests_mock, expected_path, {})
 
-        assert "Request timeout" in str(exc_info.value)
 
-    @patch("requests.Session.post")
-    def test_make_request_connection_error(self, mock_post, mock_api_key):
-        """Test handling of connection error."""
-        mock_post.side_effect = ConnectionError("Connection failed")
+def pool_response(status, body=b"", headers=None):
+    """Raw urllib3 response, for tests that exercise the adapter's retries."""
+    return HTTPResponse(
+        body=io.BytesIO(body),
+        status=status,
+        headers=headers or {},
+        preload_content=False,
+    )
 
-        client = LCWClient(api_key=mock_api_key)
 
-        with pytest.raises(LCWNetworkError) as exc_info:
-            client._make_request("test-endpoint")
+class TestLCWClientRetries:
+    """Tests for the session's retry strategy below _make_request."""
 
-        assert "Connection error" in str(exc_info.value)
+    def test_rate_limit_retried_until_success(
+        self, mock_pool_request, mock_sleep, client
+    ):
+        """Test that a 429 is retried and the eventual success returned."""
+        mock_pool_request.side_effect = [
+            pool_response(429),
+            pool_response(429),
+            pool_response(200, b'{"ok": 1}', {"Content-Type": "application/json"}),
+        ]
 
-    @patch("requests.Session.post")
-    def test_make_request_generic_request_error(self, mock_post, mock_api_key):
-        """Test handling of generic request error."""
-        mock_post.side_effect = requests.exceptions.RequestException("Generic error")
+        result = client._make_request("status")
 
-        client = LCWClient(api_key=mock_api_key)
+        assert result == {"ok": 1}
+        assert mock_pool_request.call_count == 3
+
+    def test_rate_limit_backoff_doubles_until_retries_exhausted(
+        self, mock_pool_request, mock_sleep, client
+    ):
+        """Test exponential backoff on repeated 429s, then giving up."""
+        mock_pool_request.side_effect = [pool_response(429) for _ in range(4)]
+
+        with pytest.raises(LCWRateLimitError):
+            client._make_request("status")
 
-        with pytest.raises(LCWNetworkError) as exc_info:
-            client._make_request("test-endpoint")
+        # One initial attempt plus max_retries; the first retry is immediate
+        # and each later delay doubles, plus up to 0.5s of jitter
+        assert mock_pool_request.call_count == 4
+        delays = [c.args[0] for c in mock_sleep.call_args_list]
+        assert len(delays) == 2
+        assert 1 <= delays[0] <= 1.5
+        assert 2 <= delays[1] <= 2.5
 
-        assert "Request failed: Generic error" in str(exc_info.value)
+    def test_rate_limit_honors_retry_after(self, mock_pool_request, mock_sleep, client):
+        """Test that a 429's Retry-After header replaces the backoff delay."""
+        mock_pool_request.side_effect = [
+            pool_response(429, headers={"Retry-After": "2"}),
+            pool_response(200, b"{}", {"Content-Type": "application/json"}),
+        ]
+
+        client._make_request("status")
+
+        assert mock_pool_request.call_count == 2
+        mock_sleep.assert_called_once_with(2)
 
 
 class TestLCWClientStatusMethods:
     """Tests for status and credits methods."""
 
-    @patch("src.lcw_fetcher.api.client.LCWClient._make_request")
-    def test_check_status(self, mock_make_request, mock_api_key):
+    def test_check_status(self, mock_make_request, client):
         """Test check_status method."""
         expected_response = {"status": "ok", "timestamp": 1642204800}
         mock_make_request.return_value = expected_response
 
-        client = LCWClient(api_key=mock_api_key)
         result = client.check_status()
 
         assert result == expected_response
         mock_make_request.assert_called_once_with("status")
 
-    @patch("src.lcw_fetcher.api.client.LCWClient._make_request")
-    def test_get_credits(self, mock_make_request, mock_api_key):
+    def test_get_credits(self, mock_make_request, client):
         """Test get_credits method."""
         expected_response = {"credits": 9500, "remaining": 500}
         mock_make_request.return_value = expected_response
 
-        client = LCWClient(api_key=mock_api_key)
         result = client.get_credits()
 
         assert result == expected_response
@@ -254,17 +405,10 @@ class TestLCWClientStatusMethods:
 class TestLCWClientCoinMethods:
     """Tests for coin-related methods."""
 
-    @patch("src.lcw_fetcher.api.client.LCWClient._make_request")
-    def test_get_coin_single(self, mock_make_request, mock_api_key, sample_coin_data):
+    def test_get_coin_single(self, mock_make_request, client, api_coin_response):
         """Test get_coin_single method."""
-        # Remove fields that are added by the client
-        api_response = sample_coin_data.copy()
-        api_response.pop("currency", None)
-        api_response.pop("code", None)
-
-        mock_make_request.return_value = api_response
+        mock_make_request.return_value = api_coin_response
 
-        client = LCWClient(api_key=mock_api_key)
         result = client.get_coin_single("BTC", currency="USD", meta=True)
 
         assert isinstance(result, Coin)
@@ -275,18 +419,12 @@ class TestLCWClientCoinMethods:
         expected_payload = {"currency": "USD", "code": "BTC", "meta": True}
         mock_make_request.assert_called_once_with("coins/single", expected_payload)
 
-    @patch("src.lcw_fetcher.api.client.LCWClient._make_request")
     def test_get_coin_single_default_params(
-        self, mock_make_request, mock_api_key, sample_coin_data
+        self, mock_make_request, client, api_coin_response
     ):
         """Test get_coin_single method with default parameters."""
-        api_response = sample_coin_data.copy()
-        api_response.pop("currency", None)
-        api_response.pop("code", None)
+        mock_make_request.return_value = api_coin_response
 
-        mock_make_request.return_value = api_response
-
-        client = LCWClient(api_key=mock_api_key)
         result = client.get_coin_single("btc")  # Lowercase should be converted
 
         assert isinstance(result, Coin)
@@ -297,20 +435,15 @@ class TestLCWClientCoinMethods:
         expected_payload = {"currency": "USD", "code": "BTC", "meta": True}
         mock_make_request.assert_called_once_with("coins/single", expected_payload)
 
-    @patch("src.lcw_fetcher.api.client.LCWClient._make_request")
     def test_get_coin_history_with_datetime(
-        self, mock_make_request, mock_api_key, sample_coin_data
+        self, mock_make_request, client, api_coin_response
     ):
         """Test get_coin_history method with datetime objects."""
-        api_response = sample_coin_data.copy()
-        api_response.pop("currency", None)
-
-        mock_make_request.return_value = api_response
+        mock_make_request.return_value = dict(api_coin_response, code="BTC")
 
         start_time = datetime(2024, 1, 1, 0, 0, 0)
         end_time = datetime(2024, 1, 2, 0, 0, 0)
 
-        client = LCWClient(api_key=mock_api_key)
         result = client.get_coin_history("BTC", start_time, end_time)
 
         assert isinstance(result, Coin)
@@ -328,20 +461,15 @@ class TestLCWClientCoinMethods:
             "coins/single/history", expected_payload
         )
 
-    @patch("src.lcw_fetcher.api.client.LCWClient._make_request")
     def test_get_coin_history_with_timestamps(
-        self, mock_make_request, mock_api_key, sample_coin_data
+        self, mock_make_request, client, api_coin_response
     ):
         """Test get_coin_history method with timestamp integers."""
-        api_response = sample_coin_data.copy()
-        api_response.pop("currency", None)
-
-        mock_make_request.return_value = api_response
+        mock_make_request.return_value = dict(api_coin_response, code="BTC")
 
         start_timestamp = 1640995200000  # 2022-01-01 in milliseconds
         end_timestamp = 1641081600000  # 2022-01-02 in milliseconds
 
-        client = LCWClient(api_key=mock_api_key)
         result = client.get_coin_history(
             "BTC", start_timestamp, end_timestamp, currency="EUR"
         )
@@ -360,140 +488,60 @@ class TestLCWClientCoinMethods:
             "coins/single/history", expected_payload
         )
 
-    @patch("src.lcw_fetcher.api.client.LCWClient._make_request")
-    def test_get_coins_list(self, mock_make_request, mock_api_key, sample_coin_data):
-        """Test get_coins_list method."""
-        # Create list of coin data
-        coin_list = [sample_coin_data.copy() for _ in range(3)]
-        for i, coin in enumerate(coin_list):
-            coin["code"] = f"COIN{i+1}"
-            coin.pop("currency", None)  # Remove currency as it's added by client
 
-        mock_make_request.return_value = coin_list
-
-        client = LCWClient(api_key=mock_api_key)
-        result = client.get_coins_list(
-            currency="EUR",
-            sort="volume",
-            order="descending",
-            offset=10,
-            limit=50,
-            meta=True,
-        )
-
-        assert isinstance(result, list)
-        assert len(result) == 3
-        assert all(isinstance(coin, Coin) for coin in result)
-        assert all(coin.currency == "EUR" for coin in result)
-
-        expected_payload = {
-            "currency": "EUR",
-            "sort": "volume",
-            "order": "descending",
-            "offset": 10,
-            "limit": 50,
-            "meta": True,
-        }
-        mock_make_request.assert_called_once_with("coins/list", expected_payload)
-
-    @patch("src.lcw_fetcher.api.client.LCWClient._make_request")
-    def test_get_coins_list_default_params(
-        self, mock_make_request, mock_api_key, sample_coin_data
-    ):
-        """Test get_coins_list method with default parameters."""
-        coin_list = [sample_coin_data.copy()]
-        coin_list[0].pop("currency", None)
-
-        mock_make_request.return_value = coin_list
-
-        client = LCWClient(api_key=mock_api_key)
-        result = client.get_coins_list()
-
-        assert len(result) == 1
-
-        expected_payload = {
-            "currency": "USD",
-            "sort": "rank",
-            "order": "ascending",
-            "offset": 0,
-            "limit": 100,
-            "meta": False,
-        }
-        mock_make_request.assert_called_once_with("coins/list", expected_payload)
-
-
-class TestLCWClientExchangeMethods:
-    """Tests for exchange-related methods."""
-
-    @patch("src.lcw_fetcher.api.client.LCWClient._make_request")
-    def test_get_exchanges_list(
-        self, mock_make_request, mock_api_key, sample_exchange_data
+class TestLCWClientListMethods:
+    """Tests for the paginated coin and exchange list methods."""
+
+    @pytest.mark.parametrize("method,endpoint,custom,default,model", LIST_METHOD_CASES)
+    def test_list_method(
+        self,
+        mock_make_request,
+        client,
+        api_list_factory,
+        method,
+        endpoint,
+        custom,
+        default,
+        model,
     ):
-        """Test get_exchanges_list method."""
-        exchange_list = [sample_exchange_data.copy() for _ in range(2)]
-        for i, exchange in enumerate(exchange_list):
-            exchange["code"] = f"exchange{i+1}"
-            exchange.pop("currency", None)
-
-        mock_make_request.return_value = exchange_list
+        """Test list methods with custom parameters."""
+        mock_make_request.return_value = api_list_factory(model, 3)
 
-        client = LCWClient(api_key=mock_api_key)
-        result = client.get_exchanges_list(
-            currency="EUR",
-            sort="volume",
-            order="ascending",
-            offset=5,
-            limit=25,
-            meta=True,
-        )
+        result = getattr(client, method)(**custom)
 
         assert isinstance(result, list)
-        assert len(result) == 2
-        assert all(isinstance(exchange, Exchange) for exchange in result)
-        assert all(exchange.currency == "EUR" for exchange in result)
-
-        expected_payload = {
-            "currency": "EUR",
-            "sort": "volume",
-            "order": "ascending",
-            "offset": 5,
-            "limit": 25,
-            "meta": True,
-        }
-        mock_make_request.assert_called_once_with("exchanges/list", expected_payload)
-
-    @patch("src.lcw_fetcher.api.client.LCWClient._make_request")
-    def test_get_exchanges_list_default_params(
-        self, mock_make_request, mock_api_key, sample_exchange_data
+        assert len(result) == 3
+        assert all(isinstance(item, model) for item in result)
+        assert all(item.currency == "EUR" for item in result)
+        mock_make_request.assert_called_once_with(endpoint, custom)
+
+    @pytest.mark.parametrize("method,endpoint,custom,default,model", LIST_METHOD_CASES)
+    def test_list_method_default_params(
+        self,
+        mock_make_request,
+        client,
+        api_list_factory,
+        method,
+        endpoint,
+        custom,
+        default,
+        model,
     ):
-        """Test get_exchanges_list method with default parameters."""
-        exchange_list = [sample_exchange_data.copy()]
-        exchange_list[0].pop("currency", None)
+        """Test list methods with default parameters."""
+        mock_make_request.return_value = api_list_factory(model, 1)
 
-        mock_make_request.return_value = exchange_list
-
-        client = LCWClient(api_key=mock_api_key)
-        result = client.get_exchanges_list()
+        result = getattr(client, method)()
 
         assert len(result) == 1
-
-        expected_payload = {
-            "currency": "USD",
-            "sort": "visitors",
-            "order": "descending",
-            "offset": 0,
-            "limit": 50,
-            "meta": False,
-        }
-        mock_make_request.assert_called_once_with("exchanges/list", expected_payload)
+        assert isinstance(result[0], model)
+        mock_make_request.assert_called_once_with(endpoint, default)
 
 
 class TestLCWClientMarketMethods:
     """Tests for market overview methods."""
 
-    @patch("src.lcw_fetcher.api.client.LCWClient._make_request")
     def test_get_overview_dict_response(
-        self, mock_make_request, mock_api_key, sample_market_data
+        self, mock_make_request, client, sample_market_data
     ):
         """Test get_overview method when API returns dict."""
         api_response = sample_market_data.copy()
@@ -501,7 +549,6 @@ class TestLCWClientMarketMethods:
 
         mock_make_request.return_value = api_response
 
-        client = LCWClient(api_key=mock_api_key)
         result = client.get_overview(currency="EUR")
 
         assert isinstance(result, list)
@@ -512,9 +559,8 @@ class TestLCWClientMarketMethods:
         expected_payload = {"currency": "EUR"}
         mock_make_request.assert_called_once_with("overview", expected_payload)
 
-    @patch("src.lcw_fetcher.api.client.LCWClient._make_request")
     def test_get_overview_list_response(
-        self, mock_make_request, mock_api_key, sample_market_data
+        self, mock_make_request, client, sample_market_data
     ):
         """Test get_overview method when API returns list."""
         api_response = [sample_market_data.copy() for _ in range(2)]
@@ -523,7 +569,6 @@ class TestLCWClientMarketMethods:
 
         mock_make_request.return_value = api_response
 
-        client = LCWClient(api_key=mock_api_key)
         result = client.get_overview()
 
         assert isinstance(result, list)
@@ -531,9 +576,8 @@ class TestLCWClientMarketMethods:
         assert all(isinstance(market, Market) for market in result)
         assert all(market.currency == "USD" for market in result)
 
-    @patch("src.lcw_fetcher.api.client.LCWClient._make_request")
     def test_get_overview_default_currency(
-        self, mock_make_request, mock_api_key, sample_market_data
+        self, mock_make_request, client, sample_market_data
     ):
         """Test get_overview method with default currency."""
         api_response = sample_market_data.copy()
@@ -541,7 +585,6 @@ class TestLCWClientMarketMethods:
 
         mock_make_request.return_value = api_response
 
-        client = LCWClient(api_key=mock_api_key)
         result = client.get_overview()
 
         assert result[0].currency == "USD"
@@ -559,36 +602,28 @@ class TestLCWClientEdgeCases:
         assert client.api_key == ""
         assert client.session.headers["x-api-key"] == ""
 
-    @patch("src.lcw_fetcher.api.client.LCWClient._make_request")
-    def test_coin_methods_with_empty_response(self, mock_make_request, mock_api_key):
+    def test_coin_methods_with_empty_response(self, mock_make_request, client):
         """Test coin methods with empty API response."""
         mock_make_request.return_value = []
 
-        client = LCWClient(api_key=mock_api_key)
         result = client.get_coins_list()
 
         assert result == []
 
-    @patch("src.lcw_fetcher.api.client.LCWClient._make_request")
-    def test_exchange_methods_with_empty_response(
-        self, mock_make_request, mock_api_key
-    ):
+    def test_exchange_methods_with_empty_response(self, mock_make_request, client):
         """Test exchange methods with empty API response."""
         mock_make_request.return_value = []
 
-        client = LCWClient(api_key=mock_api_key)
         result = client.get_exchanges_list()
 
         assert result == []
 
-    @patch("src.lcw_fetcher.api.client.LCWClient._make_request")
-    def test_coin_single_with_missing_fields(self, mock_make_request, mock_api_key):
+    def test_coin_single_with_missing_fields(self, mock_make_request, client):
         """Test get_coin_single with minimal API response."""
-        # Minimal response with only required fields for Coin model
-        minimal_response = {"name": "Bitcoin", "rate": 45000.0}
-        mock_make_request.return_value = minimal_response
+        # get_coin_single adds code and currency to the response in place, so
+        # hand it a copy of the shared payload
+        mock_make_request.return_value = dict(MINIMAL_COIN_RESPONSE)
 
-        client = LCWClient(api_key=mock_api_key)
         result = client.get_coin_single("BTC")
 
         assert isinstance(result, Coin)
@@ -596,27 +631,20 @@ class TestLCWClientEdgeCases:
         assert result.name == "Bitcoin"
         assert result.rate == 45000.0
 
-    def test_client_str_representation(self, mock_api_key):
+    def test_client_str_representation(self, client):
         """Test string representation of client doesn't expose API key."""
-        client = LCWClient(api_key=mock_api_key)
         client_str = str(client)
 
         # API key should not be in string representation for security
-        assert mock_api_key not in client_str
+        assert client.api_key not in client_str
         assert "LCWClient" in client_str
 
-    @patch("src.lcw_fetcher.api.client.LCWClient._make_request")
     def test_special_characters_in_coin_code(
-        self, mock_make_request, mock_api_key, sample_coin_data
+        self, mock_make_request, client, api_coin_response
     ):
         """Test handling of special characters in coin codes."""
-        api_response = sample_coin_data.copy()
-        api_response.pop("currency", None)
-        api_response.pop("code", None)
-
-        mock_make_request.return_value = api_response
+        mock_make_request.return_value = api_coin_response
 
-        client = LCWClient(api_key=mock_api_key)
         result = client.get_coin_single("BTC-USD")  # Hypothetical pair code
 
         assert result.code == "BTC-USD"
@@ -4,6 +4,10 @@ Unit tests for LCW API exceptions.
 Tests cover all custom exception classes and their behavior.
 """
 
+import operator
+import pickle
+from types import MappingProxyType
+
 import pytest
 
 from src.lcw_fetcher.api.exceptions import (
@@ -13,38 +17,84 @@ from src.lcw_fetcher.api.exceptions import (
     LCWRateLimitError,
 )
 
+UNICODE_MESSAGE = "错误信息 - Error message 🚫"
+MULTILINE_MESSAGE = "Line 1\nLine 2\nLine 3"
+LONG_MESSAGE = "x" * 10000
 
-class TestLCWAPIError:
-    """Tests for the base LCWAPIError exception."""
-
-    def test_api_error_creation_with_message(self):
-        """Test creating LCWAPIError with message."""
-        error = LCWAPIError("Something went wrong")
-
-        assert str(error) == "Something went wrong"
-        assert error.status_code is None
-        assert error.response_data is None
-
-    def test_api_error_creation_with_status_code(self):
-        """Test creating LCWAPIError with status code."""
-        error = LCWAPIError("Bad request", status_code=400)
-
-        assert str(error) == "Bad request"
-        assert error.status_code == 400
-        assert error.response_data is None
-
-    def test_api_error_creation_with_response_data(self):
-        """Test creating LCWAPIError with response data."""
-        response_data = {"error": {"code": 400, "description": "Bad request"}}
-        error = LCWAPIError("Bad request", status_code=400, response_data=response_data)
+GET_ERROR_ATTRS = operator.attrgetter("status_code", "response_data", "args")
 
-        assert str(error) == "Bad request"
-        assert error.status_code == 400
-        assert error.response_data == response_data
+ERROR_TYPES = {
+    "auth": LCWAuthError,
+    "rate": LCWRateLimitError,
+    "network": LCWNetworkError,
+    "other": LCWAPIError,
+}
 
-    def test_api_error_inheritance(self):
-        """Test that LCWAPIError inherits from Exception."""
-        error = LCWAPIError("Test error")
+# Read-only response payloads, shared by every test that attaches one
+BAD_REQUEST_DATA = MappingProxyType(
+    {"error": {"code": 400, "description": "Bad request"}}
+)
+RETRY_AFTER_DATA = MappingProxyType({"retry_after": 60})
+CUSTOM_ERROR_DATA = MappingProxyType({"error": "Custom error data"})
+
+EXC_CASES = [
+    pytest.param(LCWAPIError, "Something went wrong", {}, id="api_error"),
+    pytest.param(
+        LCWAPIError, "Bad request", {"status_code": 400}, id="api_error_status"
+    ),
+    pytest.param(
+        LCWAPIError,
+        "Bad request",
+        {"status_code": 400, "response_data": BAD_REQUEST_DATA},
+        id="api_error_response_data",
+    ),
+    pytest.param(
+        LCWRateLimitError,
+        "Rate limit exceeded",
+        {"status_code": 429},
+        id="rate_limit",
+    ),
+    pytest.param(
+        LCWRateLimitError, "API rate limit exceeded", {}, id="rate_limit_no_status"
+    ),
+    pytest.param(
+        LCWRateLimitError,
+        "Rate limit exceeded",
+        {"status_code": 429, "response_data": RETRY_AFTER_DATA},
+        id="rate_limit_retry_after",
+    ),
+    pytest.param(
+        LCWAuthError, "Invalid API key", {"status_code": 401}, id="auth_invalid_key"
+    ),
+    pytest.param(
+        LCWAuthError, "Access forbidden", {"status_code": 403}, id="auth_forbidden"
+    ),
+    pytest.param(LCWAuthError, "Auth failed", {}, id="auth_no_status"),
+    # Network errors typically don't have status codes
+    pytest.param(LCWNetworkError, "Connection timeout", {}, id="network_timeout"),
+    pytest.param(
+        LCWNetworkError,
+        "Request timeout after 30 seconds",
+        {},
+        id="network_request_timeout",
+    ),
+    pytest.param(LCWNetworkError, "Connection refused", {}, id="network_refused"),
+    pytest.param(LCWNetworkError, "DNS resolution failed", {}, id="network_dns"),
+]
+
+
+class TestExceptionConstruction:
+    """Tests for constructing each exception class."""
+
+    @pytest.mark.parametrize("exc_class,message,kwargs", EXC_CASES)
+    def test_construction(self, exc_class, message, kwargs):
+        """Test message, attributes and base class of a new exception."""
+        error = exc_class(message, **kwargs)
+
+        assert str(error) == message
+        assert error.status_code == kwargs.get("status_code")
+        assert error.response_data == kwargs.get("response_data")
+        assert isinstance(error, LCWAPIError)
         assert isinstance(error, Exception)
 
     def test_api_error_repr(self):
@@ -57,111 +107,12 @@ class TestLCWAPIError:
         assert "400" in repr_str
 
 
-class TestLCWRateLimitError:
-    """Tests for the LCWRateLimitError exception."""
-
-    def test_rate_limit_error_creation(self):
-        """Test creating LCWRateLimitError."""
-        error = LCWRateLimitError("Rate limit exceeded", status_code=429)
-
-        assert str(error) == "Rate limit exceeded"
-        assert error.status_code == 429
-        assert isinstance(error, LCWAPIError)
-
-    def test_rate_limit_error_default_message(self):
-        """Test LCWRateLimitError with default handling."""
-        error = LCWRateLimitError("API rate limit exceeded")
-
-        assert "rate limit" in str(error).lower()
-        assert isinstance(error, LCWAPIError)
-
-    def test_rate_limit_error_with_retry_after(self):
-        """Test LCWRateLimitError with retry-after information."""
-        response_data = {"retry_after": 60}
-        error = LCWRateLimitError(
-            "Rate limit exceeded", status_code=429, response_data=response_data
-        )
-
-        assert error.response_data["retry_after"] == 60
-
-
-class TestLCWAuthError:
-    """Tests for the LCWAuthError exception."""
-
-    def test_auth_error_creation(self):
-        """Test creating LCWAuthError."""
-        error = LCWAuthError("Invalid API key", status_code=401)
-
-        assert str(error) == "Invalid API key"
-        assert error.status_code == 401
-        assert isinstance(error, LCWAPIError)
-
-    def test_auth_error_forbidden(self):
-        """Test LCWAuthError for forbidden access."""
-        error = LCWAuthError("Access forbidden", status_code=403)
-
-        assert str(error) == "Access forbidden"
-        assert error.status_code == 403
-
-    def test_auth_error_inheritance(self):
-        """Test LCWAuthError inheritance chain."""
-        error = LCWAuthError("Auth failed")
-
-        assert isinstance(error, LCWAPIError)
-        assert isinstance(error, Exception)
-
-
-class TestLCWNetworkError:
-    """Tests for the LCWNetworkError exception."""
-
-    def test_network_error_creation(self):
-        """Test creating LCWNetworkError."""
-        error = LCWNetworkError("Connection timeout")
-
-        assert str(error) == "Connection timeout"
-        assert (
-            error.status_code is None
-        )  # Network errors typically don't have status codes
-        assert isinstance(error, LCWAPIError)
-
-    def test_network_error_timeout(self):
-        """Test LCWNetworkError for timeout scenarios."""
-        error = LCWNetworkError("Request timeout after 30 seconds")
-
-        assert "timeout" in str(error).lower()
-
-    def test_network_error_connection_failed(self):
-        """Test LCWNetworkError for connection failures."""
-        error = LCWNetworkError("Connection refused")
-
-        assert "connection" in str(error).lower()
-
-    def test_network_error_dns_resolution(self):
-        """Test LCWNetworkError for DNS issues."""
-        error = LCWNetworkError("DNS resolution failed")
-
-        assert "DNS" in str(error)
-
-
 class TestExceptionChaining:
     """Tests for exception chaining and context."""
 
-    def test_exception_chaining_with_cause(self):
-        """Test exception chaining with __cause__."""
-        try:
-            # Simulate an underlying exception
-            raise ValueError("Original error")
-        except ValueError as original_error:
-            # Chain with our custom exception
-            new_error = LCWAPIError("Wrapped error")
-            new_error.__cause__ = original_error
-
-            assert new_error.__cause__ is original_error
-            assert isinstance(new_error.__cause__, ValueError)
-
     def test_raising_with_from_clause(self):
         """Test raising with 'from' clause for proper chaining."""
-        with pytest.raises(LCWNetworkError) as exc_info:
+        with pytest.raises(LCWNetworkError, match="Failed to connect") as exc_info:
             try:
                 raise ConnectionError("Network issue")
             except ConnectionError as e:
@@ -174,19 +125,32 @@ class TestExceptionChaining:
 class TestExceptionAttributes:
     """Tests for exception attributes and properties."""
 
-    def test_all_exceptions_have_required_attributes(self):
+    def test_all_exceptions_have_required_attributes(self, sample_exceptions):
         """Test that all exception classes have the expected attributes."""
-        exceptions = [
-            LCWAPIError("test"),
-            LCWRateLimitError("test"),
-            LCWAuthError("test"),
-            LCWNetworkError("test"),
-        ]
-
-        for exc in exceptions:
-            assert hasattr(exc, "status_code")
-            assert hasattr(exc, "response_data")
-            assert hasattr(exc, "args")
+        # A missing attribute raises AttributeError and fails the test
+        for exc in sample_exceptions:
+            status_code, response_data, args = GET_ERROR_ATTRS(exc)
+            assert args == ("test",)
+
+    def test_exception_attributes_use_slots(self, sample_exceptions):
+        """Test that the custom attributes live in slots, not the instance dict."""
+        for exc in sample_exceptions:
+            assert "status_code" not in vars(exc)
+            assert "response_data" not in vars(exc)
+
+    def test_exception_pickle_round_trip(self, exception_classes):
+        """Test that slot attributes and notes survive pickling."""
+        for exc_class in exception_classes:
+            error = exc_class("test", status_code=429, response_data={"retry": 60})
+            error.add_note("while fetching coins")
+
+            restored = pickle.loads(pickle.dumps(error))
+
+            assert type(restored) is exc_class
+            assert restored.args == ("test",)
+            assert restored.status_code == 429
+            assert restored.response_data == {"retry": 60}
+            assert restored.__notes__ == ["while fetching coins"]
 
     def test_exception_attributes_default_values(self):
         """Test default values for exception attributes."""
@@ -198,40 +162,29 @@ class TestExceptionAttributes:
 
     def test_exception_attributes_custom_values(self):
         """Test custom values for exception attributes."""
-        response_data = {"error": "Custom error data"}
         error = LCWAPIError(
-            "test message", status_code=418, response_data=response_data
+            "test message", status_code=418, response_data=CUSTOM_ERROR_DATA
         )
 
         assert error.status_code == 418
-        assert error.response_data == response_data
+        assert error.response_data is CUSTOM_ERROR_DATA
         assert error.args == ("test message",)
 
 
 class TestExceptionUsagePatterns:
     """Tests for common exception usage patterns."""
 
-    def test_catching_base_exception(self):
+    def test_catching_base_exception(self, exception_classes):
         """Test catching the base LCWAPIError."""
-        with pytest.raises(LCWAPIError):
-            raise LCWRateLimitError("Rate limited")
+        for exc_class in exception_classes:
+            with pytest.raises(LCWAPIError):
+                raise exc_class("test")
 
-        with pytest.raises(LCWAPIError):
-            raise LCWAuthError("Unauthorized")
-
-        with pytest.raises(LCWAPIError):
-            raise LCWNetworkError("Network error")
-
-    def test_catching_specific_exceptions(self):
+    def test_catching_specific_exceptions(self, exception_classes):
         """Test catching specific exception types."""
-        with pytest.raises(LCWRateLimitError):
-            raise LCWRateLimitError("Rate limited")
-
-        with pytest.raises(LCWAuthError):
-            raise LCWAuthError("Unauthorized")
-
-        with pytest.raises(LCWNetworkError):
-            raise LCWNetworkError("Network error")
+        for exc_class in exception_classes:
+            with pytest.raises(exc_class):
+                raise exc_class("test")
 
     def test_exception_handling_hierarchy(self):
         """Test exception handling follows proper hierarchy."""
@@ -239,70 +192,50 @@ class TestExceptionUsagePatterns:
         def raise_rate_limit_error():
             raise LCWRateLimitError("Too many requests")
 
-        # Specific exception should be caught first
-        try:
+        # The specific type must be raised, not merely an LCWAPIError
+        with pytest.raises(LCWRateLimitError, match="requests"):
             raise_rate_limit_error()
-            assert False, "Exception should have been raised"
-        except LCWRateLimitError as e:
-            assert "requests" in str(e)
-        except LCWAPIError:
-            assert False, "Should have caught LCWRateLimitError specifically"
-
-    def test_multiple_exception_types(self):
-        """Test handling multiple exception types."""
-
-        def raise_various_errors(error_type):
-            if error_type == "auth":
-                raise LCWAuthError("Unauthorized")
-            elif error_type == "rate":
-                raise LCWRateLimitError("Rate limited")
-            elif error_type == "network":
-                raise LCWNetworkError("Network error")
-            else:
-                raise LCWAPIError("Generic error")
 
-        # Test catching different types
-        with pytest.raises(LCWAuthError):
-            raise_various_errors("auth")
-
-        with pytest.raises(LCWRateLimitError):
-            raise_various_errors("rate")
+    @pytest.mark.parametrize(
+        "exc_class", list(ERROR_TYPES.values()), ids=list(ERROR_TYPES)
+    )
+    def test_multiple_exception_types(self, exc_class):
+        """Test each error is caught as LCWAPIError but not by its siblings."""
+        siblings = tuple(
+            other for other in ERROR_TYPES.values() if not issubclass(exc_class, other)
+        )
 
-        with pytest.raises(LCWNetworkError):
-            raise_various_errors("network")
+        with pytest.raises(LCWAPIError) as exc_info:
+            try:
+                raise exc_class("test error")
+            except siblings:
+                pytest.fail(f"{exc_class.__name__} caught by a sibling class")
 
-        with pytest.raises(LCWAPIError):
-            raise_various_errors("other")
+        assert type(exc_info.value) is exc_class
 
 
 class TestExceptionMessages:
     """Tests for exception message formatting and content."""
 
-    def test_empty_message(self):
-        """Test exceptions with empty messages."""
-        error = LCWAPIError("")
-        assert str(error) == ""
-
-    def test_none_message(self):
-        """Test exceptions with None message."""
-        error = LCWAPIError(None)
-        assert str(error) == "None"
-
-    def test_unicode_message(self):
-        """Test exceptions with Unicode messages."""
-        unicode_msg = "错误信息 - Error message 🚫"
-        error = LCWAPIError(unicode_msg)
-        assert str(error) == unicode_msg
-
-    def test_multiline_message(self):
-        """Test exceptions with multiline messages."""
-        multiline_msg = "Line 1\nLine 2\nLine 3"
-        error = LCWAPIError(multiline_msg)
-        assert str(error) == multiline_msg
-
-    def test_very_long_message(self):
-        """Test exceptions with very long messages."""
-        long_msg = "x" * 10000
-        error = LCWAPIError(long_msg)
-        assert str(error) == long_msg
-        assert len(str(error)) == 10000
+    @pytest.mark.parametrize(
+        "message,expected",
+        [pytest.param("", "", id="empty"), pytest.param(None, "None", id="none")],
+    )
+    def test_trivial_message(self, message, expected):
+        """Test exceptions with empty or None messages."""
+        assert str(LCWAPIError(message)) == expected
+
+    @pytest.mark.parametrize(
+        "message",
+        [
+            pytest.param(UNICODE_MESSAGE, id="unicode"),
+            pytest.param(MULTILINE_MESSAGE, id="multiline"),
+            pytest.param(LONG_MESSAGE, id="very_long"),
+        ],
+    )
+    def test_message_preserved(self, message):
+        """Test that unusual messages come back from str() untouched."""
+        error = LCWAPIError(message)
+        # str() hands back the message object itself rather than a copy
+        assert error.args[0] is message
+        assert str(error) is message
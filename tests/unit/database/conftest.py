@@ -0,0 +1,64 @@
+"""
+Fixtures shared by the database unit tests.
+"""
+
+from unittest.mock import create_autospec
+
+import pytest
+
+from src.lcw_fetcher.database.influx_client import InfluxDBClient
+
+CLIENT_KWARGS = {
+    "url": "http://localhost:8086",
+    "token": "test-token",
+    "org": "test-org",
+    "bucket": "test-bucket",
+}
+
+
+@pytest.fixture
+def influx_client():
+    """Fixture providing an unconnected InfluxDB client."""
+    return InfluxDBClient(**CLIENT_KWARGS)
+
+
+@pytest.fixture(scope="module")
+def _api_specs():
+    """Autospecced influxdb_client client, write and query APIs.
+
+    Built on first use rather than at import, so runs that select only the
+    unconnected tests skip the introspection; the connected_client fixture
+    resets them after every test.
+    """
+    from influxdb_client import InfluxDBClient as BaseInfluxDBClient
+    from influxdb_client import QueryApi, WriteApi
+
+    return (
+        create_autospec(BaseInfluxDBClient, instance=True),
+        create_autospec(WriteApi, instance=True),
+        create_autospec(QueryApi, instance=True),
+    )
+
+
+@pytest.fixture(scope="class")
+def _wired_client(_api_specs):
+    """Client with mocked APIs, built once per test class."""
+    client = InfluxDBClient(**CLIENT_KWARGS)
+    client._client, client._write_api, client._query_api = _api_specs
+    return client
+
+
+@pytest.fixture
+def connected_client(_wired_client):
+    """Fixture providing a client in the connected state.
+
+    The API mocks are shared across tests and reset after each one instead
+    of being rebuilt, so tests may freely set return values and side effects.
+    """
+    yield _wired_client
+    for api in (
+        _wired_client._client,
+        _wired_client._write_api,
+        _wired_client._query_api,
+    ):
+        api.reset_mock(return_value=True, side_effect=True)
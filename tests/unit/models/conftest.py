@@ -0,0 +1,64 @@
+"""
+Fixtures shared by the model unit tests.
+"""
+
+from datetime import datetime
+from typing import List
+
+import pytest
+from pydantic import TypeAdapter
+
+from src.lcw_fetcher.models import Coin, CoinHistory, Exchange, Market
+
+# fetched_at default for models built under the frozen_clock fixture
+FROZEN_NOW = datetime(2024, 1, 1)
+
+
+@pytest.fixture
+def frozen_clock():
+    """Freeze time at FROZEN_NOW for the duration of one test."""
+    freezegun = pytest.importorskip("freezegun")
+    with freezegun.freeze_time(FROZEN_NOW):
+        yield FROZEN_NOW
+
+
+@pytest.fixture(scope="session")
+def sample_market(sample_market_data):
+    """Market built once from sample_market_data; tests must not mutate it."""
+    return Market(**sample_market_data)
+
+
+@pytest.fixture(scope="session")
+def coin_adapter():
+    """TypeAdapter for Coin, built once per session."""
+    return TypeAdapter(Coin)
+
+
+@pytest.fixture(scope="session")
+def exchange_adapter():
+    """TypeAdapter for Exchange, built once per session."""
+    return TypeAdapter(Exchange)
+
+
+@pytest.fixture(scope="session")
+def coin_list_adapter():
+    """TypeAdapter validating a list of Coin in a single call."""
+    return TypeAdapter(List[Coin])
+
+
+@pytest.fixture(scope="session")
+def exchange_list_adapter():
+    """TypeAdapter validating a list of Exchange in a single call."""
+    return TypeAdapter(List[Exchange])
+
+
+@pytest.fixture(scope="session")
+def history_list_adapter():
+    """TypeAdapter validating a list of CoinHistory rows in a single call."""
+    return TypeAdapter(List[CoinHistory])
+
+
+@pytest.fixture(scope="session")
+def market_list_adapter():
+    """TypeAdapter validating a list of Market in a single call."""
+    return TypeAdapter(List[Market])
@@ -5,13 +5,52 @@ Tests cover model validation, serialization, InfluxDB point conversion,
 and edge cases for the Coin model.
 """
 
+import json
 from datetime import datetime
 
 import pytest
 from pydantic import ValidationError
 
 from src.lcw_fetcher.models import Coin, CoinDelta, CoinHistory
-from tests.conftest import assert_influx_point_valid
+from tests.conftest import (
+    JSON_SERIALIZERS,
+    assert_influx_point_valid,
+    influx_field_types,
+)
+
+# (constructor kwargs, expected InfluxDB fields) for extreme numeric values
+NUMERIC_EDGE_CASES = [
+    pytest.param(
+        {"code": "BTC", "rate": 1e15, "volume": 1e20, "cap": 1e25},
+        {"rate": 1e15, "volume": 1e20, "market_cap": 1e25},
+        id="very-large",
+    ),
+    pytest.param(
+        {"code": "SHIB", "rate": 0.00000001},
+        {"rate": 0.00000001},
+        id="very-small",
+    ),
+    pytest.param(
+        {"code": "TEST", "rate": 0.0, "volume": 0.0, "cap": 0.0},
+        {"rate": 0.0, "volume": 0.0, "market_cap": 0.0},
+        id="zero",
+    ),
+]
+
+
+def make_coin(**kwargs):
+    """Build a Coin without validation, for tests of the output format only.
+
+    Nested values must already be models (e.g. CoinDelta), since nothing
+    converts them.
+    """
+    return Coin.model_construct(**kwargs)
+
+
+@pytest.fixture(scope="module")
+def minimal_coin():
+    """Coin with only a code and rate, shared by the conversion tests."""
+    return Coin(code="BTC", rate=45000.0)
 
 
 class TestCoinDelta:
@@ -80,7 +119,30 @@ class TestCoinHistory:
                 cap=850000000000.0,
             )
 
-        assert "Date must be a positive timestamp" in str(exc_info.value)
+        (error,) = exc_info.value.errors()
+        assert error["type"] == "value_error"
+        assert error["loc"] == ("date",)
+        assert "Date must be a positive timestamp" in error["msg"]
+
+    def test_coin_history_batch(self, history_list_adapter, sample_coin_history_data):
+        """Test validating several history rows in one call."""
+        history = history_list_adapter.validate_python(sample_coin_history_data)
+
+        assert [row.rate for row in history] == [44500.0, 44800.0, 45000.0]
+        assert all(isinstance(row, CoinHistory) for row in history)
+
+    def test_coin_history_batch_reports_row(
+        self, history_list_adapter, sample_coin_history_data
+    ):
+        """Test that a bad row in a batch is reported by its index."""
+        rows = list(sample_coin_history_data)
+        rows[1] = {**rows[1], "date": -1}
+
+        with pytest.raises(ValidationError) as exc_info:
+            history_list_adapter.validate_python(rows)
+
+        (error,) = exc_info.value.errors()
+        assert error["loc"] == (1, "date")
 
     def test_coin_history_zero_date(self):
         """Test CoinHistory with zero date."""
@@ -91,7 +153,7 @@ class TestCoinHistory:
 class TestCoin:
     """Tests for the Coin model."""
 
-    def test_coin_creation_minimal(self, sample_coin_data):
+    def test_coin_creation_minimal(self, sample_coin_data, frozen_clock):
         """Test creating Coin with minimal required data."""
         minimal_data = {"code": "BTC", "rate": 45000.0}
 
@@ -100,11 +162,11 @@ class TestCoin:
         assert coin.code == "BTC"
         assert coin.rate == 45000.0
         assert coin.currency == "USD"  # Default value
-        assert isinstance(coin.fetched_at, datetime)
+        assert coin.fetched_at == frozen_clock
 
-    def test_coin_creation_full_data(self, sample_coin_data):
+    def test_coin_creation_full_data(self, coin_adapter, sample_coin_data):
         """Test creating Coin with full data."""
-        coin = Coin(**sample_coin_data)
+        coin = coin_adapter.validate_python(sample_coin_data)
 
         assert coin.code == "BTC"
         assert coin.name == "Bitcoin"
@@ -184,10 +246,9 @@ class TestCoin:
 class TestCoinInfluxConversion:
     """Tests for Coin to InfluxDB point conversion."""
 
-    def test_to_influx_point_minimal(self):
+    def test_to_influx_point_minimal(self, minimal_coin):
         """Test InfluxDB point conversion with minimal data."""
-        coin = Coin(code="BTC", rate=45000.0)
-        point = coin.to_influx_point()
+        point = minimal_coin.to_influx_point()
 
         assert_influx_point_valid(point)
 
@@ -197,9 +258,9 @@ class TestCoinInfluxConversion:
         assert point["fields"]["rate"] == 45000.0
         assert isinstance(point["time"], datetime)
 
-    def test_to_influx_point_full_data(self, sample_coin_data):
+    def test_to_influx_point_full_data(self, coin_adapter, sample_coin_data):
         """Test InfluxDB point conversion with full data."""
-        coin = Coin(**sample_coin_data)
+        coin = coin_adapter.validate_python(sample_coin_data)
         point = coin.to_influx_point()
 
         assert_influx_point_valid(point)
@@ -221,9 +282,10 @@ class TestCoinInfluxConversion:
         assert point["fields"]["delta_7d"] == -1.2
         assert point["fields"]["delta_30d"] == 15.7
 
+    @pytest.mark.serialization_only
     def test_to_influx_point_with_none_values(self):
         """Test InfluxDB point conversion with None values."""
-        coin = Coin(code="BTC", rate=45000.0, volume=None, cap=None, rank=None)
+        coin = make_coin(code="BTC", rate=45000.0, volume=None, cap=None, rank=None)
         point = coin.to_influx_point()
 
         assert_influx_point_valid(point)
@@ -234,30 +296,27 @@ class TestCoinInfluxConversion:
         assert "market_cap" not in point["fields"]
         assert "rank" not in point["fields"]
 
+    @pytest.mark.serialization_only
     def test_to_influx_point_no_code(self):
         """Test InfluxDB point conversion when code is None."""
-        coin = Coin(rate=45000.0)
-        coin.code = None  # Set to None after creation
+        coin = make_coin(rate=45000.0)
         point = coin.to_influx_point()
 
         assert point["tags"]["code"] == "UNKNOWN"
 
-    def test_to_influx_point_no_name(self):
+    def test_to_influx_point_no_name(self, minimal_coin):
         """Test InfluxDB point conversion when name is None."""
-        coin = Coin(code="BTC", rate=45000.0)
-        point = coin.to_influx_point()
+        point = minimal_coin.to_influx_point()
 
         assert point["tags"]["name"] == ""
 
+    @pytest.mark.serialization_only
     def test_to_influx_point_partial_delta(self):
         """Test InfluxDB point conversion with partial delta data."""
-        delta_data = {
-            "hour": 1.5,
-            "day": 2.3,
-            # week, month, quarter, year are None
-        }
+        # week, month, quarter, year are None
+        delta = CoinDelta(hour=1.5, day=2.3)
 
-        coin = Coin(code="BTC", rate=45000.0, delta=delta_data)
+        coin = make_coin(code="BTC", rate=45000.0, delta=delta)
         point = coin.to_influx_point()
 
         # Only non-None delta fields should be included
@@ -276,9 +335,11 @@ class TestCoinInfluxConversion:
         )
         point = coin.to_influx_point()
 
-        assert isinstance(point["fields"]["rate"], float)
-        assert isinstance(point["fields"]["volume"], float)
-        assert isinstance(point["fields"]["rank"], int)
+        assert influx_field_types(point) == {
+            "rate": float,
+            "volume": float,
+            "rank": int,
+        }
 
         assert point["fields"]["rate"] == 45000.50
         assert point["fields"]["volume"] == 28500000000.0
@@ -288,67 +349,50 @@ class TestCoinInfluxConversion:
 class TestCoinEdgeCases:
     """Tests for edge cases and error conditions."""
 
-    def test_coin_with_very_large_numbers(self):
-        """Test Coin with very large numeric values."""
-        coin = Coin(
-            code="BTC",
-            rate=1e15,  # Very large rate
-            volume=1e20,  # Very large volume
-            cap=1e25,  # Very large market cap
-        )
+    @pytest.mark.parametrize("kwargs, expected_fields", NUMERIC_EDGE_CASES)
+    def test_coin_numeric_edges(self, kwargs, expected_fields):
+        """Test Coin with extreme and zero numeric values."""
+        coin = Coin(**kwargs)
 
-        assert coin.rate == 1e15
-        assert coin.volume == 1e20
-        assert coin.cap == 1e25
+        for name, value in kwargs.items():
+            assert getattr(coin, name) == value
 
-        point = coin.to_influx_point()
-        assert point["fields"]["rate"] == 1e15
+        assert coin.to_influx_point()["fields"] == expected_fields
 
-    def test_coin_with_very_small_numbers(self):
-        """Test Coin with very small numeric values."""
-        coin = Coin(
-            code="SHIB",
-            rate=0.00000001,  # Very small rate
+    def test_coin_numeric_edges_bulk(self, coin_list_adapter):
+        """Test validating all numeric edge cases as one batch."""
+        coins = coin_list_adapter.validate_python(
+            [case.values[0] for case in NUMERIC_EDGE_CASES]
         )
 
-        assert coin.rate == 0.00000001
+        assert [coin.to_influx_point()["fields"] for coin in coins] == [
+            case.values[1] for case in NUMERIC_EDGE_CASES
+        ]
 
-        point = coin.to_influx_point()
-        assert point["fields"]["rate"] == 0.00000001
+    def test_coin_serialization_deserialization(self, coin_adapter, sample_coin_data):
+        """Test that Coin survives a JSON round-trip."""
+        original_coin = coin_adapter.validate_python(sample_coin_data)
 
-    def test_coin_with_zero_values(self):
-        """Test Coin with zero values."""
-        coin = Coin(code="TEST", rate=0.0, volume=0.0, cap=0.0)
-
-        point = coin.to_influx_point()
-        assert point["fields"]["rate"] == 0.0
-        assert point["fields"]["volume"] == 0.0
-        assert point["fields"]["market_cap"] == 0.0
-
-    def test_coin_serialization_deserialization(self, sample_coin_data):
-        """Test that Coin can be serialized and deserialized."""
-        original_coin = Coin(**sample_coin_data)
-
-        # Serialize to dict
-        coin_dict = original_coin.model_dump()
-
-        # Deserialize back to Coin
-        restored_coin = Coin(**coin_dict)
+        # Round-trip through JSON without an intermediate Python dict
+        restored_coin = Coin.model_validate_json(original_coin.model_dump_json())
 
         # Compare key fields
         assert restored_coin.code == original_coin.code
         assert restored_coin.rate == original_coin.rate
         assert restored_coin.volume == original_coin.volume
         assert restored_coin.cap == original_coin.cap
-
-    def test_coin_json_serialization(self, sample_coin_data):
-        """Test JSON serialization of Coin."""
-        coin = Coin(**sample_coin_data)
-
-        json_str = coin.model_dump_json()
-        assert isinstance(json_str, str)
-        assert "BTC" in json_str
-        assert "Bitcoin" in json_str
+        assert restored_coin == original_coin
+
+    @pytest.mark.parametrize("serialize", JSON_SERIALIZERS)
+    def test_coin_json_serialization(self, serialize, coin_adapter, sample_coin_data):
+        """Test JSON serialization of Coin matches model_dump_json()."""
+        coin = coin_adapter.validate_python(sample_coin_data)
+
+        json_bytes = serialize(coin)
+        assert isinstance(json_bytes, bytes)
+        assert b"BTC" in json_bytes
+        assert b"Bitcoin" in json_bytes
+        assert json.loads(json_bytes) == json.loads(coin.model_dump_json())
 
     @pytest.mark.parametrize("invalid_code", [None, "", "  ", "\t\n"])
     def test_coin_invalid_codes(self, invalid_code):
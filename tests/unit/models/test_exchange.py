@@ -5,29 +5,79 @@ Tests cover model validation, serialization, InfluxDB point conversion,
 and edge cases for the Exchange model.
 """
 
+import json
 from datetime import datetime
 
 import pytest
 from pydantic import ValidationError
 
 from src.lcw_fetcher.models import Exchange
-from tests.conftest import assert_influx_point_valid
+from tests.conftest import (
+    JSON_SERIALIZERS,
+    assert_influx_point_valid,
+    influx_field_types,
+)
+
+# Codes and their expected normalized forms, spelled out rather than derived
+# with .upper() so the tests do not share logic with the validator
+LONG_CODE = "a" * 100
+LONG_CODE_UPPER = "A" * 100
+SPECIAL_CODE = "binance-us_test.123"
+SPECIAL_CODE_UPPER = "BINANCE-US_TEST.123"
+
+# (constructor kwargs, expected InfluxDB fields) for extreme numeric values
+NUMERIC_EDGE_CASES = [
+    pytest.param(
+        {"code": "binance", "volume": 1e20, "visitors": 1e10},
+        {"record_count": 1, "volume": 1e20, "visitors": 1e10},
+        id="very-large",
+    ),
+    pytest.param(
+        # Rank should not be zero for a valid exchange
+        {
+            "code": "test",
+            "volume": 0.0,
+            "visitors": 0,
+            "volumePerVisitor": 0.0,
+            "rank": 1,
+        },
+        {
+            "record_count": 1,
+            "volume": 0.0,
+            "visitors": 0,
+            "volume_per_visitor": 0.0,
+            "rank": 1,
+        },
+        id="zero",
+    ),
+]
+
+
+def make_exchange(**kwargs):
+    """Build an Exchange without validation, for tests of the output format only."""
+    return Exchange.model_construct(**kwargs)
+
+
+@pytest.fixture(scope="module")
+def minimal_exchange():
+    """Exchange with only a code, shared by the conversion tests."""
+    return Exchange(code="binance")
 
 
 class TestExchange:
     """Tests for the Exchange model."""
 
-    def test_exchange_creation_minimal(self):
+    def test_exchange_creation_minimal(self, frozen_clock):
         """Test creating Exchange with minimal required data."""
         exchange = Exchange(code="binance")
 
         assert exchange.code == "BINANCE"  # Should be uppercased
         assert exchange.currency == "USD"  # Default value
-        assert isinstance(exchange.fetched_at, datetime)
+        assert exchange.fetched_at == frozen_clock
 
-    def test_exchange_creation_full_data(self, sample_exchange_data):
+    def test_exchange_creation_full_data(self, exchange_adapter, sample_exchange_data):
         """Test creating Exchange with full data."""
-        exchange = Exchange(**sample_exchange_data)
+        exchange = exchange_adapter.validate_python(sample_exchange_data)
 
         assert exchange.code == "BINANCE"  # Should be uppercased
         assert exchange.name == "Binance"
@@ -50,13 +100,19 @@ class TestExchange:
         """Test validation with empty code."""
         with pytest.raises(ValidationError) as exc_info:
             Exchange(code="")
-        assert "Exchange code cannot be empty" in str(exc_info.value)
+        (error,) = exc_info.value.errors()
+        assert error["type"] == "value_error"
+        assert error["loc"] == ("code",)
+        assert "Exchange code cannot be empty" in error["msg"]
 
     def test_exchange_code_validation_whitespace_only(self):
         """Test validation with whitespace-only code."""
         with pytest.raises(ValidationError) as exc_info:
             Exchange(code="   ")
-        assert "Exchange code cannot be empty" in str(exc_info.value)
+        (error,) = exc_info.value.errors()
+        assert error["type"] == "value_error"
+        assert error["loc"] == ("code",)
+        assert "Exchange code cannot be empty" in error["msg"]
 
     def test_exchange_code_validation_none(self):
         """Test validation with None code."""
@@ -85,10 +141,9 @@ class TestExchange:
 class TestExchangeInfluxConversion:
     """Tests for Exchange to InfluxDB point conversion."""
 
-    def test_to_influx_point_minimal(self):
+    def test_to_influx_point_minimal(self, minimal_exchange):
         """Test InfluxDB point conversion with minimal data."""
-        exchange = Exchange(code="binance")
-        point = exchange.to_influx_point()
+        point = minimal_exchange.to_influx_point()
 
         assert_influx_point_valid(point)
 
@@ -103,9 +158,9 @@ class TestExchangeInfluxConversion:
         assert "record_count" in point["fields"]
         assert point["fields"]["record_count"] == 1
 
-    def test_to_influx_point_full_data(self, sample_exchange_data):
+    def test_to_influx_point_full_data(self, exchange_adapter, sample_exchange_data):
         """Test InfluxDB point conversion with full data."""
-        exchange = Exchange(**sample_exchange_data)
+        exchange = exchange_adapter.validate_python(sample_exchange_data)
         point = exchange.to_influx_point()
 
         assert_influx_point_valid(point)
@@ -120,9 +175,10 @@ class TestExchangeInfluxConversion:
         assert point["fields"]["visitors"] == 85000000
         assert point["fields"]["volume_per_visitor"] == 176.47
 
+    @pytest.mark.serialization_only
     def test_to_influx_point_partial_data(self):
         """Test InfluxDB point conversion with partial data."""
-        exchange = Exchange(
+        exchange = make_exchange(
             code="binance",
             name="Binance",
             volume=15000000000.0,
@@ -143,10 +199,9 @@ class TestExchangeInfluxConversion:
         assert point["fields"]["volume"] == 15000000000.0
         assert point["fields"]["rank"] == 1
 
-    def test_to_influx_point_no_name(self):
+    def test_to_influx_point_no_name(self, minimal_exchange):
         """Test InfluxDB point conversion when name is None."""
-        exchange = Exchange(code="binance")
-        point = exchange.to_influx_point()
+        point = minimal_exchange.to_influx_point()
 
         assert point["tags"]["name"] == ""
 
@@ -161,10 +216,13 @@ class TestExchangeInfluxConversion:
         )
         point = exchange.to_influx_point()
 
-        assert isinstance(point["fields"]["volume"], float)
-        assert isinstance(point["fields"]["visitors"], int)
-        assert isinstance(point["fields"]["volume_per_visitor"], float)
-        assert isinstance(point["fields"]["rank"], int)
+        assert influx_field_types(point) == {
+            "record_count": int,
+            "volume": float,
+            "visitors": int,
+            "volume_per_visitor": float,
+            "rank": int,
+        }
 
         assert point["fields"]["volume"] == 15000000000.0
         assert point["fields"]["visitors"] == 85000000
@@ -175,61 +233,57 @@ class TestExchangeInfluxConversion:
 class TestExchangeEdgeCases:
     """Tests for edge cases and error conditions."""
 
-    def test_exchange_with_very_large_numbers(self):
-        """Test Exchange with very large numeric values."""
-        exchange = Exchange(
-            code="binance",
-            volume=1e20,  # Very large volume
-            visitors=1e10,  # Very large visitor count
-        )
+    @pytest.mark.parametrize("kwargs, expected_fields", NUMERIC_EDGE_CASES)
+    def test_exchange_numeric_edges(self, kwargs, expected_fields):
+        """Test Exchange with extreme and zero numeric values."""
+        exchange = Exchange(**kwargs)
 
-        assert exchange.volume == 1e20
-        assert exchange.visitors == 1e10
+        for name, value in kwargs.items():
+            if name != "code":
+                assert getattr(exchange, name) == value
 
-        point = exchange.to_influx_point()
-        assert point["fields"]["volume"] == 1e20
-        assert point["fields"]["visitors"] == 1e10
+        assert exchange.to_influx_point()["fields"] == expected_fields
 
-    def test_exchange_with_zero_values(self):
-        """Test Exchange with zero values."""
-        exchange = Exchange(
-            code="test",
-            volume=0.0,
-            visitors=0,
-            volumePerVisitor=0.0,
-            rank=1,  # Rank should not be zero for a valid exchange
+    def test_exchange_numeric_edges_bulk(self, exchange_list_adapter):
+        """Test validating all numeric edge cases as one batch."""
+        exchanges = exchange_list_adapter.validate_python(
+            [case.values[0] for case in NUMERIC_EDGE_CASES]
         )
 
-        point = exchange.to_influx_point()
-        assert point["fields"]["volume"] == 0.0
-        assert point["fields"]["visitors"] == 0
-        assert point["fields"]["volume_per_visitor"] == 0.0
-        assert point["fields"]["rank"] == 1
-
-    def test_exchange_serialization_deserialization(self, sample_exchange_data):
-        """Test that Exchange can be serialized and deserialized."""
-        original_exchange = Exchange(**sample_exchange_data)
+        assert [exchange.to_influx_point()["fields"] for exchange in exchanges] == [
+            case.values[1] for case in NUMERIC_EDGE_CASES
+        ]
 
-        # Serialize to dict
-        exchange_dict = original_exchange.model_dump()
+    def test_exchange_serialization_deserialization(
+        self, exchange_adapter, sample_exchange_data
+    ):
+        """Test that Exchange survives a JSON round-trip."""
+        original_exchange = exchange_adapter.validate_python(sample_exchange_data)
 
-        # Deserialize back to Exchange
-        restored_exchange = Exchange(**exchange_dict)
+        # Round-trip through JSON without an intermediate Python dict
+        restored_exchange = Exchange.model_validate_json(
+            original_exchange.model_dump_json()
+        )
 
         # Compare key fields
         assert restored_exchange.code == original_exchange.code
         assert restored_exchange.name == original_exchange.name
         assert restored_exchange.volume == original_exchange.volume
         assert restored_exchange.visitors == original_exchange.visitors
+        assert restored_exchange == original_exchange
 
-    def test_exchange_json_serialization(self, sample_exchange_data):
-        """Test JSON serialization of Exchange."""
-        exchange = Exchange(**sample_exchange_data)
+    @pytest.mark.parametrize("serialize", JSON_SERIALIZERS)
+    def test_exchange_json_serialization(
+        self, serialize, exchange_adapter, sample_exchange_data
+    ):
+        """Test JSON serialization of Exchange matches model_dump_json()."""
+        exchange = exchange_adapter.validate_python(sample_exchange_data)
 
-        json_str = exchange.model_dump_json()
-        assert isinstance(json_str, str)
-        assert "BINANCE" in json_str
-        assert "Binance" in json_str
+        json_bytes = serialize(exchange)
+        assert isinstance(json_bytes, bytes)
+        assert b"BINANCE" in json_bytes
+        assert b"Binance" in json_bytes
+        assert json.loads(json_bytes) == json.loads(exchange.model_dump_json())
 
     @pytest.mark.parametrize("invalid_code", ["", "  ", "\t\n", None])
     def test_exchange_invalid_codes(self, invalid_code):
@@ -264,17 +318,15 @@ class TestExchangeEdgeCases:
 
     def test_exchange_very_long_code(self):
         """Test Exchange with very long code."""
-        long_code = "a" * 100  # Very long code
-        exchange = Exchange(code=long_code)
+        exchange = Exchange(code=LONG_CODE)
 
-        assert exchange.code == long_code.upper()
+        assert exchange.code == LONG_CODE_UPPER
 
     def test_exchange_special_characters_in_code(self):
         """Test Exchange with special characters in code."""
-        special_code = "binance-us_test.123"
-        exchange = Exchange(code=special_code)
+        exchange = Exchange(code=SPECIAL_CODE)
 
-        assert exchange.code == special_code.upper()
+        assert exchange.code == SPECIAL_CODE_UPPER
 
     def test_exchange_unicode_name(self):
         """Test Exchange with Unicode characters in name."""
@@ -5,47 +5,149 @@ Tests cover model validation, serialization, InfluxDB point conversion,
 and edge cases for the Market model.
 """
 
+import json
 from datetime import datetime
 
 import pytest
-from pydantic import ValidationError
 
 from src.lcw_fetcher.models import Market
-from tests.conftest import assert_influx_point_valid
+from tests.conftest import (
+    JSON_SERIALIZERS,
+    assert_influx_point_valid,
+    influx_field_types,
+)
+
+# InfluxDB field name for each numeric Market attribute
+INFLUX_FIELD_MAP = {
+    "total_market_cap": "cap",
+    "total_volume": "volume",
+    "total_liquidity": "liquidity",
+    "btc_dominance": "btcDominance",
+}
+
+# InfluxDB fields expected from sample_market_data
+SAMPLE_MARKET_FIELDS = {
+    "record_count": 1,
+    "total_market_cap": 2500000000000.0,
+    "total_volume": 95000000000.0,
+    "total_liquidity": 8500000000.0,
+    "btc_dominance": 42.5,
+}
+
+# (constructor kwargs, expected InfluxDB fields) for extreme numeric values
+NUMERIC_EDGE_CASES = [
+    pytest.param(
+        {"cap": 1e25, "volume": 1e23, "liquidity": 1e22, "btcDominance": 99.99},
+        {
+            "total_market_cap": 1e25,
+            "total_volume": 1e23,
+            "total_liquidity": 1e22,
+            "btc_dominance": 99.99,
+        },
+        id="very-large",
+    ),
+    pytest.param(
+        {"cap": 0.001, "volume": 0.0001, "liquidity": 0.00001, "btcDominance": 0.01},
+        {
+            "total_market_cap": 0.001,
+            "total_volume": 0.0001,
+            "total_liquidity": 0.00001,
+            "btc_dominance": 0.01,
+        },
+        id="very-small",
+    ),
+    pytest.param(
+        {"cap": 0.0, "volume": 0.0, "liquidity": 0.0, "btcDominance": 0.0},
+        {
+            "total_market_cap": 0.0,
+            "total_volume": 0.0,
+            "total_liquidity": 0.0,
+            "btc_dominance": 0.0,
+        },
+        id="zero",
+    ),
+    # Negative values are unusual but allowed by the model
+    pytest.param(
+        {"cap": -1000.0, "volume": -500.0, "liquidity": -100.0, "btcDominance": -5.0},
+        {
+            "total_market_cap": -1000.0,
+            "total_volume": -500.0,
+            "total_liquidity": -100.0,
+            "btc_dominance": -5.0,
+        },
+        id="negative",
+    ),
+    pytest.param(
+        {"btcDominance": 100.0}, {"btc_dominance": 100.0}, id="full-dominance"
+    ),
+    # Over 100% dominance is theoretically impossible but allowed by the model
+    pytest.param(
+        {"btcDominance": 150.0}, {"btc_dominance": 150.0}, id="over-dominance"
+    ),
+]
+
+# (constructor kwargs, expected InfluxDB fields besides record_count)
+INFLUX_CASES = [
+    pytest.param({}, {}, id="minimal"),
+    pytest.param(
+        {"cap": 2500000000000.0, "btcDominance": 42.5},
+        {"total_market_cap": 2500000000000.0, "btc_dominance": 42.5},
+        id="partial",
+    ),
+]
+
+
+def make_market(**kwargs):
+    """Build a Market without validation, for tests of the output format only."""
+    return Market.model_construct(**kwargs)
+
+
+def assert_point_fields(point, market):
+    """Assert every mapped InfluxDB field holds the market's attribute value."""
+    expected = {
+        field: getattr(market, attr) for field, attr in INFLUX_FIELD_MAP.items()
+    }
+    assert {field: point["fields"].get(field) for field in expected} == expected
+
+
+@pytest.fixture
+def empty_market_point(frozen_clock):
+    """InfluxDB point of a Market with every value left at its default.
+
+    Built under the frozen clock so its time matches other Markets made in
+    the same test.
+    """
+    return Market().to_influx_point()
 
 
 class TestMarket:
     """Tests for the Market model."""
 
-    def test_market_creation_minimal(self):
+    def test_market_creation_minimal(self, frozen_clock):
         """Test creating Market with minimal data."""
         market = Market()
 
         assert market.currency == "USD"  # Default value
-        assert isinstance(market.fetched_at, datetime)
+        assert market.fetched_at == frozen_clock
         assert market.cap is None
         assert market.volume is None
         assert market.liquidity is None
         assert market.btcDominance is None
 
-    def test_market_creation_full_data(self, sample_market_data):
+    def test_market_creation_full_data(self, sample_market):
         """Test creating Market with full data."""
-        market = Market(**sample_market_data)
+        assert sample_market.cap == 2500000000000.0
+        assert sample_market.volume == 95000000000.0
+        assert sample_market.liquidity == 8500000000.0
+        assert sample_market.btcDominance == 42.5
+        assert sample_market.currency == "USD"
 
-        assert market.cap == 2500000000000.0
-        assert market.volume == 95000000000.0
-        assert market.liquidity == 8500000000.0
-        assert market.btcDominance == 42.5
-        assert market.currency == "USD"
-
-    def test_market_optional_fields_none(self):
+    def test_market_optional_fields_none(self, frozen_clock):
         """Test that all market fields can be None."""
         market = Market(cap=None, volume=None, liquidity=None, btcDominance=None)
 
-        assert market.cap is None
-        assert market.volume is None
-        assert market.liquidity is None
-        assert market.btcDominance is None
+        # Same as leaving every value at its default
+        assert market == Market()
 
     def test_market_partial_data(self):
         """Test creating Market with partial data."""
@@ -70,57 +172,29 @@ class TestMarket:
 class TestMarketInfluxConversion:
     """Tests for Market to InfluxDB point conversion."""
 
-    def test_to_influx_point_minimal(self):
-        """Test InfluxDB point conversion with minimal data."""
-        market = Market()
-        point = market.to_influx_point()
+    @pytest.mark.parametrize("kwargs,expected_fields", INFLUX_CASES)
+    def test_to_influx_point(self, kwargs, expected_fields, frozen_clock):
+        """Test InfluxDB point conversion includes only non-None fields."""
+        point = Market(**kwargs).to_influx_point()
 
         assert_influx_point_valid(point)
 
         assert point["measurement"] == "market_overview"
         assert point["tags"]["currency"] == "USD"
-        assert isinstance(point["time"], datetime)
+        assert point["time"] == frozen_clock
 
-        # Only record_count should be present when all values are None
-        assert len(point["fields"]) == 1
-        assert "record_count" in point["fields"]
-        assert point["fields"]["record_count"] == 1
+        # record_count is always present, even when all values are None
+        assert point["fields"] == {"record_count": 1, **expected_fields}
 
-    def test_to_influx_point_full_data(self, sample_market_data):
+    def test_to_influx_point_full_data(self, sample_market):
         """Test InfluxDB point conversion with full data."""
-        market = Market(**sample_market_data)
-        point = market.to_influx_point()
-
-        assert_influx_point_valid(point)
+        point = sample_market.to_influx_point()
 
         # Check tags
         assert point["tags"]["currency"] == "USD"
 
         # Check fields
-        assert point["fields"]["total_market_cap"] == 2500000000000.0
-        assert point["fields"]["total_volume"] == 95000000000.0
-        assert point["fields"]["total_liquidity"] == 8500000000.0
-        assert point["fields"]["btc_dominance"] == 42.5
-
-    def test_to_influx_point_partial_data(self):
-        """Test InfluxDB point conversion with partial data."""
-        market = Market(
-            cap=2500000000000.0,
-            btcDominance=42.5,
-            # volume and liquidity are None
-        )
-        point = market.to_influx_point()
-
-        assert_influx_point_valid(point)
-
-        # Only non-None fields should be included
-        assert "total_market_cap" in point["fields"]
-        assert "btc_dominance" in point["fields"]
-        assert "total_volume" not in point["fields"]
-        assert "total_liquidity" not in point["fields"]
-
-        assert point["fields"]["total_market_cap"] == 2500000000000.0
-        assert point["fields"]["btc_dominance"] == 42.5
+        assert point["fields"] == SAMPLE_MARKET_FIELDS
 
     def test_to_influx_point_custom_currency(self):
         """Test InfluxDB point conversion with custom currency."""
@@ -139,125 +213,63 @@ class TestMarketInfluxConversion:
         )
         point = market.to_influx_point()
 
-        assert isinstance(point["fields"]["total_market_cap"], float)
-        assert isinstance(point["fields"]["total_volume"], float)
-        assert isinstance(point["fields"]["total_liquidity"], float)
-        assert isinstance(point["fields"]["btc_dominance"], float)
+        assert influx_field_types(point) == {
+            "record_count": int,
+            **dict.fromkeys(INFLUX_FIELD_MAP, float),
+        }
 
-        assert point["fields"]["total_market_cap"] == 2500000000000.0
-        assert point["fields"]["total_volume"] == 95000000000.0
-        assert point["fields"]["total_liquidity"] == 8500000000.0
-        assert point["fields"]["btc_dominance"] == 42.5
+        assert point["fields"] == SAMPLE_MARKET_FIELDS
 
 
 class TestMarketEdgeCases:
     """Tests for edge cases and error conditions."""
 
-    def test_market_with_very_large_numbers(self):
-        """Test Market with very large numeric values."""
-        market = Market(
-            cap=1e25,  # Very large market cap
-            volume=1e23,  # Very large volume
-            liquidity=1e22,  # Very large liquidity
-            btcDominance=99.99,  # Near 100% dominance
-        )
-
-        assert market.cap == 1e25
-        assert market.volume == 1e23
-        assert market.liquidity == 1e22
-        assert market.btcDominance == 99.99
-
-        point = market.to_influx_point()
-        assert point["fields"]["total_market_cap"] == 1e25
-        assert point["fields"]["total_volume"] == 1e23
-        assert point["fields"]["total_liquidity"] == 1e22
-        assert point["fields"]["btc_dominance"] == 99.99
-
-    def test_market_with_zero_values(self):
-        """Test Market with zero values."""
-        market = Market(cap=0.0, volume=0.0, liquidity=0.0, btcDominance=0.0)
-
-        point = market.to_influx_point()
-        assert point["fields"]["total_market_cap"] == 0.0
-        assert point["fields"]["total_volume"] == 0.0
-        assert point["fields"]["total_liquidity"] == 0.0
-        assert point["fields"]["btc_dominance"] == 0.0
-
-    def test_market_with_negative_values(self):
-        """Test Market with negative values (unusual but allowed by model)."""
-        market = Market(
-            cap=-1000.0,  # Negative market cap (unusual)
-            volume=-500.0,  # Negative volume (unusual)
-            liquidity=-100.0,  # Negative liquidity (unusual)
-            btcDominance=-5.0,  # Negative dominance (unusual)
-        )
-
-        # These should be accepted by the model
-        assert market.cap == -1000.0
-        assert market.volume == -500.0
-        assert market.liquidity == -100.0
-        assert market.btcDominance == -5.0
-
-    def test_market_btc_dominance_edge_cases(self):
-        """Test Market with edge case BTC dominance values."""
-        # 0% dominance
-        market_zero = Market(btcDominance=0.0)
-        assert market_zero.btcDominance == 0.0
+    @pytest.mark.parametrize("kwargs,expected_fields", NUMERIC_EDGE_CASES)
+    def test_market_numeric_edges(self, kwargs, expected_fields):
+        """Test point conversion of extreme, zero and negative numeric values."""
+        point = make_market(**kwargs).to_influx_point()
 
-        # 100% dominance
-        market_full = Market(btcDominance=100.0)
-        assert market_full.btcDominance == 100.0
+        assert point["fields"] == {"record_count": 1, **expected_fields}
 
-        # Over 100% dominance (theoretically impossible but allowed by model)
-        market_over = Market(btcDominance=150.0)
-        assert market_over.btcDominance == 150.0
+    def test_market_numeric_edges_bulk(self, market_list_adapter):
+        """Test that the model accepts every numeric edge case unchanged."""
+        cases = [case.values[0] for case in NUMERIC_EDGE_CASES]
+        markets = market_list_adapter.validate_python(cases)
 
-    def test_market_very_small_numbers(self):
-        """Test Market with very small numeric values."""
-        market = Market(
-            cap=0.001,  # Very small market cap
-            volume=0.0001,  # Very small volume
-            liquidity=0.00001,  # Very small liquidity
-            btcDominance=0.01,  # Very small dominance
-        )
+        assert [
+            {name: getattr(market, name) for name in kwargs}
+            for market, kwargs in zip(markets, cases)
+        ] == cases
 
-        assert market.cap == 0.001
-        assert market.volume == 0.0001
-        assert market.liquidity == 0.00001
-        assert market.btcDominance == 0.01
+    def test_market_serialization_deserialization(self, sample_market):
+        """Test that a copied Market preserves its fields."""
+        # Validation is covered by the constructor tests; a shallow copy is
+        # enough to check that no field is dropped
+        restored_market = sample_market.model_copy(deep=False)
+        assert restored_market is not sample_market
 
-        point = market.to_influx_point()
-        assert point["fields"]["total_market_cap"] == 0.001
-        assert point["fields"]["total_volume"] == 0.0001
-        assert point["fields"]["total_liquidity"] == 0.00001
-        assert point["fields"]["btc_dominance"] == 0.01
+        # Compare key fields
+        assert restored_market.cap == sample_market.cap
+        assert restored_market.volume == sample_market.volume
+        assert restored_market.liquidity == sample_market.liquidity
+        assert restored_market.btcDominance == sample_market.btcDominance
+        assert restored_market.currency == sample_market.currency
 
-    def test_market_serialization_deserialization(self, sample_market_data):
-        """Test that Market can be serialized and deserialized."""
-        original_market = Market(**sample_market_data)
+    def test_market_json_round_trip(self, sample_market):
+        """Test that Market survives a validating JSON round-trip."""
+        restored_market = Market.model_validate_json(sample_market.model_dump_json())
 
-        # Serialize to dict
-        market_dict = original_market.model_dump()
+        assert restored_market == sample_market
 
-        # Deserialize back to Market
-        restored_market = Market(**market_dict)
+    @pytest.mark.parametrize("serialize", JSON_SERIALIZERS)
+    def test_market_json_serialization(self, serialize, sample_market):
+        """Test JSON serialization of Market matches model_dump_json()."""
+        json_bytes = serialize(sample_market)
+        assert isinstance(json_bytes, bytes)
 
-        # Compare key fields
-        assert restored_market.cap == original_market.cap
-        assert restored_market.volume == original_market.volume
-        assert restored_market.liquidity == original_market.liquidity
-        assert restored_market.btcDominance == original_market.btcDominance
-        assert restored_market.currency == original_market.currency
-
-    def test_market_json_serialization(self, sample_market_data):
-        """Test JSON serialization of Market."""
-        market = Market(**sample_market_data)
-
-        json_str = market.model_dump_json()
-        assert isinstance(json_str, str)
-        assert "2500000000000.0" in json_str
-        assert "42.5" in json_str
-        assert "USD" in json_str
+        required = (b"2500000000000.0", b"42.5", b"USD")
+        assert all(needle in json_bytes for needle in required), json_bytes
+        assert json.loads(json_bytes) == json.loads(sample_market.model_dump_json())
 
     def test_market_field_name_mapping(self):
         """Test that field names are properly mapped in InfluxDB conversion."""
@@ -265,16 +277,7 @@ class TestMarketEdgeCases:
         point = market.to_influx_point()
 
         # Check that field names are properly mapped
-        expected_fields = {
-            "total_market_cap": 1000.0,
-            "total_volume": 2000.0,
-            "total_liquidity": 3000.0,
-            "btc_dominance": 50.0,
-        }
-
-        for field_name, expected_value in expected_fields.items():
-            assert field_name in point["fields"]
-            assert point["fields"][field_name] == expected_value
+        assert_point_fields(point, market)
 
     def test_market_timestamp_precision(self):
         """Test that timestamp is preserved correctly."""
@@ -284,30 +287,12 @@ class TestMarketEdgeCases:
 
         assert point["time"] == fixed_time
 
-    def test_market_empty_vs_none_difference(self):
-        """Test difference between empty Market and Market with explicit None values."""
-        # Empty market (using defaults)
-        empty_market = Market()
-
-        # Market with explicit None values
-        explicit_none_market = Market(
+    def test_market_empty_vs_none_difference(self, empty_market_point):
+        """Test that explicit None values behave like the defaults."""
+        explicit_point = Market(
             cap=None, volume=None, liquidity=None, btcDominance=None
-        )
-
-        # Both should behave the same
-        assert empty_market.cap == explicit_none_market.cap
-        assert empty_market.volume == explicit_none_market.volume
-        assert empty_market.liquidity == explicit_none_market.liquidity
-        assert empty_market.btcDominance == explicit_none_market.btcDominance
+        ).to_influx_point()
 
         # Both should produce only the record_count field
-        empty_point = empty_market.to_influx_point()
-        explicit_point = explicit_none_market.to_influx_point()
-
-        assert len(empty_point["fields"]) == 1
-        assert "record_count" in empty_point["fields"]
-        assert empty_point["fields"]["record_count"] == 1
-
-        assert len(explicit_point["fields"]) == 1
-        assert "record_count" in explicit_point["fields"]
-        assert explicit_point["fields"]["record_count"] == 1
+        assert explicit_point == empty_market_point
+        assert empty_market_point["fields"] == {"record_count": 1}